@@ -92,9 +92,8 @@ setup(
     license = "BSD",
     platforms = ["any"],
     install_requires = [
-        "attrs>=19.2.0",
+        "attrs>=20.1.0",
         "click",
-        "importlib-metadata; python_version < '3.8'",
         "typing; python_version < '3.5'",
     ],
     extras_require = {
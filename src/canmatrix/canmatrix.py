@@ -28,11 +28,12 @@
 
 import decimal
 import fnmatch
+import functools
 import itertools
 import logging
 import math
+import re
 import struct
-import sys
 import typing
 import warnings
 from builtins import *
@@ -44,14 +45,6 @@ import canmatrix.copy
 import canmatrix.types
 import canmatrix.utils
 
-if sys.version_info < (3, 8):
-    from importlib_metadata import version
-else:
-    from importlib.metadata import version
-
-if version("attrs") < '17.4.0':
-    raise RuntimeError("need attrs >= 17.4.0")
-
 logger = logging.getLogger(__name__)
 defaultFloatFactory = decimal.Decimal  # type: typing.Callable[[typing.Any], canmatrix.types.PhysicalValue]
 
@@ -72,20 +65,112 @@ class DecodingConatainerPdu(ExceptionTemplate): pass
 class EncodingConatainerPdu(ExceptionTemplate): pass
 
 
+@functools.lru_cache(maxsize=256)
+def _compiled_glob(glob_str):  # type: (str) -> typing.Callable[[str], typing.Any]
+    """Return a function matching names against glob pattern (case sensitive, see `fnmatch.fnmatchcase`).
+
+    The pattern is translated and compiled once instead of for every name.
+    Patterns without wildcards are compared for equality.
+    """
+    if not any(wildcard in glob_str for wildcard in "*?["):
+        return lambda name: name == glob_str
+    return re.compile(fnmatch.translate(glob_str)).match
+
+
+_field_names = {}  # type: typing.Dict[type, typing.FrozenSet[str]]
+
+
+def field_names(cls):  # type: (type) -> typing.FrozenSet[str]
+    """Return the names of the public attrs fields of given class (cached per class)."""
+    names = _field_names.get(cls)
+    if names is None:
+        names = _field_names[cls] = frozenset(name for name in attr.fields_dict(cls) if not name.startswith("_"))
+    return names
+
+
+def _signal_layout_changed(signal, attribute, value):  # type: (Signal, typing.Any, typing.Any) -> typing.Any
+    """on_setattr hook of position, type and multiplexing of a Signal: edits drop the codec caches of its Frame."""
+    if signal._frame is not None:
+        signal._frame.invalidate_caches()
+    return value
+
+
+# on_setattr hooks of the keys CanMatrix looks up Frames and ECUs by: edits drop the index of the owning Matrix
+def _frame_name_changed(frame, attribute, value):  # type: (Frame, typing.Any, typing.Any) -> typing.Any
+    if frame._matrix is not None:
+        frame._matrix._frames_by_name = None
+    return value
+
+
+def _frame_id_changed(frame, attribute, value):  # type: (Frame, typing.Any, typing.Any) -> typing.Any
+    if frame._matrix is not None:
+        frame._matrix._frames_by_id = None
+    return value
+
+
+def _arbitration_id_changed(arbitration_id, attribute, value):  # type: (ArbitrationId, typing.Any, typing.Any) -> typing.Any
+    if arbitration_id._frame is not None:
+        _frame_id_changed(arbitration_id._frame, attribute, value)
+    return value
+
+
+def _ecu_name_changed(ecu, attribute, value):  # type: (Ecu, typing.Any, typing.Any) -> typing.Any
+    if ecu._matrix is not None:
+        ecu._matrix._ecus_by_name = None
+    return value
+
+
+class _AttrsState(object):
+    """Mixin for attrs classes: copy, pickle and yaml state is the dict of the attrs fields.
+
+    Slotted attrs classes would otherwise use a tuple of all fields as state.
+    Fields listed in `_transient_fields` (caches, back references) are not part of the state,
+    they get their default value when the state is restored.
+    """
+
+    __slots__ = ()
+    _transient_fields = ()  # type: typing.Tuple[str, ...]
+
+    def __getstate__(self):  # type: () -> typing.Dict[str, typing.Any]
+        cls = type(self)  # type: typing.Any
+        return {
+            field.name: getattr(self, field.name)
+            for field in attr.fields(cls)
+            if field.name not in self._transient_fields
+        }
+
+    def __setstate__(self, state):  # type: (typing.Mapping[str, typing.Any]) -> None
+        cls = type(self)  # type: typing.Any
+        for field in attr.fields(cls):
+            if field.name in state:
+                value = state[field.name]
+            elif isinstance(field.default, attr.Factory):  # type: ignore
+                value = field.default.factory(self) if field.default.takes_self else field.default.factory()
+            elif field.default is not attr.NOTHING:
+                value = field.default
+            else:
+                continue
+            object.__setattr__(self, field.name, value)
+
+
 def arbitration_id_converter(source):  # type: (typing.Union[int, ArbitrationId]) -> ArbitrationId
     """Converter for attrs which accepts ArbitrationId itself or int."""
     return source if isinstance(source, ArbitrationId) else  ArbitrationId.from_compound_integer(source)
 
 
-@attr.s
-class Ecu(object):
+@attr.s(slots=True, getstate_setstate=False)
+class Ecu(_AttrsState):
     """
     Represents one ECU.
     """
 
-    name = attr.ib()  # type: str
+    _transient_fields = ("_matrix",)
+
+    name = attr.ib(on_setattr=_ecu_name_changed)  # type: str
     comment = attr.ib(default=None)  # type: typing.Optional[str]
     attributes = attr.ib(factory=dict, repr=False)  # type: typing.MutableMapping[str, typing.Any]
+    # Matrix which indexes the ECU by name, see CanMatrix.ecu_by_name
+    _matrix = attr.ib(init=False, default=None, eq=False, repr=False)  # type: typing.Optional[CanMatrix]
 
     def attribute(self, attribute_name, db=None, default=None):  # type: (str, CanMatrix, typing.Any) -> typing.Any
         """Get Board unit attribute by its name.
@@ -134,8 +219,36 @@ def normalize_value_table(table):  # type: (typing.Mapping) -> typing.MutableMap
     return {int(k): v for k, v in table.items()}
 
 
-@attr.s(eq=False)
-class Signal(object):
+def use_decimal(enable=True):  # type: (bool) -> None
+    """Select the number type of physical values (offset, factor, min, max ...) of Signals created from now on.
+
+    Matrix loaders without explicit `float_factory` option follow this setting, too.
+    Existing Signals keep the number type they were created with.
+
+    :param bool enable: True for `decimal.Decimal` (default, exact round trip of matrix files),
+        False for `float` (much faster encoding and decoding)
+    """
+    global defaultFloatFactory
+    defaultFloatFactory = decimal.Decimal if enable else float
+
+
+def physical_value_converter(value):  # type: (typing.Any) -> canmatrix.types.PhysicalValue
+    """Converter for attrs which applies the current `defaultFloatFactory`, also the loaders default float_factory."""
+    return defaultFloatFactory(value)
+
+
+def optional_physical_value_converter(value):  # type: (typing.Any) -> canmatrix.types.OptionalPhysicalValue
+    """Converter for attrs which applies the current `defaultFloatFactory` to anything but None."""
+    return defaultFloatFactory(value) if value is not None else value
+
+
+def factor_converter(value):  # type: (typing.Any) -> canmatrix.types.PhysicalValue
+    """Converter for attrs which applies the current `defaultFloatFactory`, replacing zero by one."""
+    return defaultFloatFactory(value) if float(value) != 0 else defaultFloatFactory(1.0)
+
+
+@attr.s(eq=False, slots=True, getstate_setstate=False)
+class Signal(_AttrsState):
     """
     Represents a Signal in CAN Matrix.
 
@@ -152,22 +265,21 @@ class Signal(object):
     * multiplex ('Multiplexor' or Number of Multiplex)
     """
 
+    _transient_fields = ("_frame", "_values_reverse", "_float_factory")
+
+    # number type of the physical values, fixed at creation - see use_decimal
+    _float_factory = attr.ib(init=False, repr=False)  # type: typing.Callable[[typing.Any], canmatrix.types.PhysicalValue]
+    @_float_factory.default
+    def _current_float_factory(self):  # type: () -> typing.Callable[[typing.Any], canmatrix.types.PhysicalValue]
+        return defaultFloatFactory
+
     name = attr.ib(default="")  # type: str
-    # float_factory = attr.ib(default=defaultFloatFactory)
-    float_factory = defaultFloatFactory  # type: typing.Callable[[typing.Any], canmatrix.types.PhysicalValue]
-    start_bit = attr.ib(default=0)  # type: int
-    size = attr.ib(default=0)  # type: int
-    is_little_endian = attr.ib(default=True)  # type: bool
-    is_signed = attr.ib(default=True)  # type: bool
-    offset = attr.ib(converter=float_factory, default=float_factory(0.0))  # type: canmatrix.types.PhysicalValue
-    factor = attr.ib(
-        converter=lambda value, float_factory=float_factory: (
-            float_factory(value)
-            if float(value) != 0
-            else float_factory(1.0)
-        ),
-        default=float_factory(1.0)
-    )  # type: canmatrix.types.PhysicalValue
+    start_bit = attr.ib(default=0, on_setattr=_signal_layout_changed)  # type: int
+    size = attr.ib(default=0, on_setattr=_signal_layout_changed)  # type: int
+    is_little_endian = attr.ib(default=True, on_setattr=_signal_layout_changed)  # type: bool
+    is_signed = attr.ib(default=True, on_setattr=_signal_layout_changed)  # type: bool
+    offset = attr.ib(converter=physical_value_converter, default=0.0)  # type: canmatrix.types.PhysicalValue
+    factor = attr.ib(converter=factor_converter, default=1.0)  # type: canmatrix.types.PhysicalValue
 
     unit = attr.ib(default="")  # type: str
     receivers = attr.ib(factory=list)  # type: typing.MutableSequence[str]
@@ -175,7 +287,7 @@ class Signal(object):
     multiplex = attr.ib(default=None)  # type: typing.Union[str, int]
 
     mux_value = attr.ib(default=None)
-    is_float = attr.ib(default=False)  # type: bool
+    is_float = attr.ib(default=False, on_setattr=_signal_layout_changed)  # type: bool
     is_ascii = attr.ib(default=False)  # type: bool
     type_label = attr.ib(default="")
     enumeration = attr.ib(default=None)  # type: typing.Optional[str]
@@ -190,33 +302,40 @@ class Signal(object):
     calc_max_for_none = attr.ib(default=True)  # type: bool
 
     cycle_time = attr.ib(default=0)  # type: int
-    initial_value = attr.ib(converter=float_factory, default=float_factory(0.0))  # type: canmatrix.types.PhysicalValue
-
-    min = attr.ib(
-        converter=lambda value, float_factory=float_factory: (
-            float_factory(value)
-            if value is not None
-            else value
-        )
-    )  # type: typing.Union[int, decimal.Decimal, None]
+    # set by multiplex_setter:
+    mux_val = attr.ib(init=False, default=None, on_setattr=_signal_layout_changed)  # type: typing.Optional[int]
+    is_multiplexer = attr.ib(init=False, default=False, on_setattr=_signal_layout_changed)  # type: bool
+    # Frame the signal was added to, see Frame.add_signal
+    _frame = attr.ib(init=False, default=None, repr=False)  # type: typing.Optional[Frame]
+    # value description -> value, see phys2raw
+    _values_reverse = attr.ib(init=False, default=None, repr=False)  # type: typing.Optional[typing.Mapping[str, int]]
+    initial_value = attr.ib(converter=physical_value_converter, default=0.0)  # type: canmatrix.types.PhysicalValue
+
+    min = attr.ib(converter=optional_physical_value_converter)  # type: typing.Union[int, decimal.Decimal, None]
     @min.default
     def set_default_min(self):  # type: () -> canmatrix.types.OptionalPhysicalValue
         return self.set_min()
 
-    max = attr.ib(
-        converter=lambda value, float_factory=float_factory: (
-            float_factory(value)
-            if value is not None
-            else value
-        )
-    )  # type: canmatrix.types.OptionalPhysicalValue
+    max = attr.ib(converter=optional_physical_value_converter)  # type: canmatrix.types.OptionalPhysicalValue
     @max.default
     def set_default_max(self):
         return self.set_max()
 
     def __attrs_post_init__(self):
-        self.multiplex = self.multiplex_setter(self.multiplex)
+        # plain signals: mux_val and is_multiplexer keep their defaults
+        if self.multiplex is not None:
+            self.multiplex = self.multiplex_setter(self.multiplex)
 
+    def __setstate__(self, state):  # type: (typing.Mapping[str, typing.Any]) -> None
+        _AttrsState.__setstate__(self, state)
+        # copies keep the number type of the values, whatever the current default is
+        values = (self.offset, self.factor, self.initial_value)
+        self._float_factory = decimal.Decimal if any(isinstance(value, decimal.Decimal) for value in values) else float
+
+    @property
+    def float_factory(self):  # type: () -> typing.Callable[[typing.Any], canmatrix.types.PhysicalValue]
+        """Number type of the physical values of this Signal, see `use_decimal`."""
+        return self._float_factory
 
     @property
     def spn(self):  # type: () -> typing.Optional[int]
@@ -236,8 +355,14 @@ class Signal(object):
             self.is_multiplexer = True
             self.multiplex = 'Multiplexor'
             ret_multiplex = value
+        self._invalidate_frame_caches()
         return ret_multiplex
 
+    def _invalidate_frame_caches(self):  # type: () -> None
+        """Notify the Frame containing this signal about a changed layout."""
+        if self._frame is not None:
+            self._frame.invalidate_caches()
+
     def multiplexer_value_in_range(self, mux_value):
         if len(self.mux_val_grp) > 0 and mux_value is not None:
             for mux_min, mux_max in self.mux_val_grp:
@@ -257,7 +382,7 @@ class Signal(object):
         :param default: Default value if attribute doesn't exist.
         :return: Return the attribute value if found, else `default` or None
         """
-        if attributeName in attr.fields_dict(type(self)):
+        if attributeName in field_names(type(self)):
             return getattr(self, attributeName)
         if attributeName in self.attributes:
             return self.attributes[attributeName]
@@ -322,8 +447,10 @@ class Signal(object):
         :param int or str value: signal value (0xFF)
         :param str valueName: Human readable value description ("Init")
         """
-        if isinstance(value, defaultFloatFactory):
-            self.values[value.to_integral()] = valueName
+        if isinstance(value, decimal.Decimal):
+            self.values[value.to_integral()] = valueName  # type: ignore
+        elif isinstance(value, float):
+            self.values[int(round(value))] = valueName
         else:
             self.values[int(str(value), 0)] = valueName
 
@@ -340,9 +467,9 @@ class Signal(object):
         If startLittle is set, given start_bit is assumed start from lsb bit
         rather than the start of the signal data in the message data.
         """
-        # bit numbering not consistent with byte order. reverse
+        # bit numbering not consistent with byte order. reverse bit in byte (0 <-> 7, 1 <-> 6, ...)
         if bitNumbering is not None and bitNumbering != self.is_little_endian:
-            start_bit = start_bit - (start_bit % 8) + 7 - (start_bit % 8)
+            start_bit = int(start_bit) ^ 7
         # if given start_bit is for the end of signal data (lsbit),
         # convert to start of signal data (msbit)
         if startLittle is True and self.is_little_endian is False:
@@ -352,17 +479,20 @@ class Signal(object):
                 "wrong start_bit found Signal: %s Startbit: %d" % (self.name, start_bit)
             )
         self.start_bit = start_bit
+        self._invalidate_frame_caches()
 
     def get_startbit(self, bit_numbering=None, start_little=None):
         """Get signal start bit. Handle byte and bit order."""
+        if bit_numbering is None and start_little is None:
+            return int(self.start_bit)
         startBitInternal = self.start_bit
         # convert from big endian start bit at
         # start bit(msbit) to end bit(lsbit)
         if start_little is True and self.is_little_endian is False:
             startBitInternal = startBitInternal + self.size - 1
-        # bit numbering not consistent with byte order. reverse
+        # bit numbering not consistent with byte order. reverse bit in byte
         if bit_numbering is not None and bit_numbering != self.is_little_endian:
-            startBitInternal = startBitInternal - (startBitInternal % 8) + 7 - (startBitInternal % 8)
+            return int(startBitInternal) ^ 7
         return int(startBitInternal)
 
     def calculate_raw_range(self):
@@ -423,6 +553,15 @@ class Signal(object):
 
         return self.offset + (self.float_factory(rawMax) * self.factor)
 
+    def _raw_for_encoding(self, value):  # type: (typing.Any) -> canmatrix.types.RawValue
+        """Return raw value to encode for given value of `Frame.signals_to_bytes` data: strings are value choices."""
+        if isinstance(value, str):
+            value = self.phys2raw(value)
+            if value is None:
+                # TODO Error Handling
+                value = 0
+        return value
+
     def phys2raw(self, value=None):
         # type: (canmatrix.types.OptionalPhysicalValue) -> canmatrix.types.RawValue
         """Return the raw value (= as is on CAN).
@@ -437,17 +576,13 @@ class Signal(object):
                 value = self.min
 
         if isinstance(value, str) and self.values:
-            for value_key, value_string in self.values.items():
-                if value_string == value:
-                    value = value_key
-                    return value
+            value_key = self._value_by_name(value)
+            if value_key is not None:
+                return value_key
 
-        try:
+        if not isinstance(value, decimal.Decimal):
             value = decimal.Decimal(value)
-        except Exception as e:
-            raise e
 
-        # if not (0 <= value <= 10):
         if not (self.min <= value <= self.max):
             logger.warning(
                 "Value {} is not valid for {}. Min={} and Max={}".format(
@@ -460,6 +595,23 @@ class Signal(object):
 
         return raw_value
 
+    def _value_by_name(self, value_name):  # type: (str) -> typing.Optional[int]
+        """Return the (first) value described by value_name or None.
+
+        Uses a reverse index of `values`, which is verified on every hit and rebuilt on a miss,
+        as `values` is often modified in place.
+        """
+        reverse = self._values_reverse
+        if reverse is not None:
+            value_key = reverse.get(value_name)
+            if value_key is not None and self.values.get(value_key) == value_name:
+                return value_key
+        reverse = {}
+        for value_key, value_string in self.values.items():
+            reverse.setdefault(value_string, value_key)
+        self._values_reverse = reverse
+        return reverse.get(value_name)
+
     def raw2phys(self, value, decode_to_str=False):
         # type: (canmatrix.types.RawValue, bool) -> typing.Union[canmatrix.types.PhysicalValue, str]
         """Decode the given raw value (= as is on CAN).
@@ -471,11 +623,8 @@ class Signal(object):
         if self.is_float:
             value = self.float_factory(value)
 
-        if decode_to_str:
-            for value_key, value_string in self.values.items():
-                if value_key == value:
-                    return value_string
-                    break
+        if decode_to_str and value in self.values:
+            return self.values[value]  # type: ignore
 
         result = value * self.factor + self.offset  # type: typing.Union[canmatrix.types.PhysicalValue, str]
 
@@ -485,8 +634,8 @@ class Signal(object):
         return self.name
 
 
-@attr.s(eq=False)
-class SignalGroup(object):
+@attr.s(eq=False, slots=True, getstate_setstate=False)
+class SignalGroup(_AttrsState):
     """
     Represents signal-group, containing multiple Signals.
     """
@@ -627,14 +776,69 @@ def pack_bitstring(length, is_float, value, signed):
     return bitstring
 
 
+# every byte with its bit order reversed, for bytes.translate
+_reversed_bits = bytes(int('{:08b}'.format(byte)[::-1], 2) for byte in range(256))
+
+# struct format characters of byte aligned signals: (is_float, is_signed) -> size -> format character
+_struct_codes = {
+    (False, False): {8: 'B', 16: 'H', 32: 'I', 64: 'Q'},
+    (False, True): {8: 'b', 16: 'h', 32: 'i', 64: 'q'},
+    (True, False): {32: 'f', 64: 'd'},
+    (True, True): {32: 'f', 64: 'd'},
+}
+
+_float_structs = {
+    32: struct.Struct('>f'),
+    64: struct.Struct('>d'),
+}
+
+
+def unpack_int(length, is_float, is_signed, bits):
+    # type: (int, bool, bool, int) -> typing.Union[float, int]
+    """
+    returns a value calculated from bits, same as `unpack_bitstring` but with bits given as int
+    :param length: length of signal in bits
+    :param is_float: value is float
+    :param is_signed: value is signed
+    :param bits: value as unsigned int
+    :return:
+    """
+    if is_float:
+        value, = _float_structs[length].unpack(bits.to_bytes(length // 8, 'big'))
+    else:
+        value = bits
+        if is_signed and bits >> (length - 1):
+            value -= (1 << length)
+    return value
+
+
+def pack_int(length, is_float, value, signed):
+    # type: (int, bool, typing.Any, bool) -> int
+    """
+    returns a value in bits as unsigned int, same as `pack_bitstring`
+    :param length: length of signal in bits
+    :param is_float: value is float
+    :param value: value to encode
+    :param signed: value is signed
+    :return:
+    """
+    if is_float:
+        return int.from_bytes(_float_structs[length].pack(value), 'big')
+    return int((2 << length) + value) & ((1 << length) - 1)
+
+
 @attr.s
-class ArbitrationId(object):
+class ArbitrationId(_AttrsState):
     standard_id_mask = ((1 << 11) - 1)
     extended_id_mask = ((1 << 29) - 1)
     compound_extended_mask = (1 << 31)
 
-    id = attr.ib(default=None)
-    extended = attr.ib(default=False)  # type: bool
+    _transient_fields = ("_frame",)
+
+    id = attr.ib(default=None, on_setattr=_arbitration_id_changed)
+    extended = attr.ib(default=False, on_setattr=_arbitration_id_changed)  # type: bool
+    # Frame indexed by this id, see CanMatrix.frame_by_id
+    _frame = attr.ib(init=False, default=None, eq=False, repr=False)  # type: typing.Optional[Frame]
 
     def __attrs_post_init__(self):
         if self.extended is None:
@@ -665,13 +869,10 @@ class ArbitrationId(object):
         # Made up of PDU-S (8-15), PDU-F (16-23), Data Page (24) & Extended Data Page (25)
         # If PDU-F >= 240 the PDU-S is interpreted as Group Extension
         # If PDU-F < 240 the PDU-S is interpreted as a Destination Address
-        _pgn = 0
-        if self.j1939_pdu_format == 2:
-            _pgn += self.j1939_ps
-        _pgn += self.j1939_pf << 8
-        _pgn += self.j1939_dp << 16
-        _pgn += self.j1939_edp << 17
-
+        # PDU-F, Data Page and Extended Data Page are extracted with a single mask
+        _pgn = (self.id >> 8) & 0x3FF00
+        if _pgn & 0xFF00 >= 0xF000:  # pdu format 2
+            _pgn |= (self.id >> 8) & 0xFF
         return _pgn
 
     @pgn.setter
@@ -693,11 +894,9 @@ class ArbitrationId(object):
     def j1939_destination(self):
         if not self.extended:
             raise J1939NeedsExtendedIdentifier
-        if self.j1939_pdu_format == 1:
-            destination = self.j1939_ps
-        else:
-            destination = None
-        return destination
+        if (self.id >> 16) & 0xFF < 240:  # pdu format 1
+            return (self.id >> 8) & 0xFF
+        return None
 
     @property
     def j1939_source(self):
@@ -889,8 +1088,8 @@ class Pdu(object):
         return None
 
 
-@attr.s(eq=False)
-class Frame(object):
+@attr.s(eq=False, slots=True, getstate_setstate=False)
+class Frame(_AttrsState):
     """
     Represents CAN Frame.
 
@@ -910,9 +1109,11 @@ class Frame(object):
     Frame signals can be accessed using the iterator.
     """
 
-    name = attr.ib(default="")  # type: str
+    _transient_fields = ("_layout_cache", "_mux_signals_cache", "_mux_layout_cache", "_signals_by_name", "_matrix")
+
+    name = attr.ib(default="", on_setattr=_frame_name_changed)  # type: str
     # mypy Unsupported converter:
-    arbitration_id = attr.ib(converter=arbitration_id_converter, default=0)  # type: ArbitrationId
+    arbitration_id = attr.ib(converter=arbitration_id_converter, default=0, on_setattr=_frame_id_changed)  # type: ArbitrationId
     size = attr.ib(default=0)  # type: int
     transmitters = attr.ib(factory=list)  # type: typing.MutableSequence[str]
     # extended = attr.ib(default=False)  # type: bool
@@ -939,6 +1140,27 @@ class Frame(object):
 
     secOC_properties = attr.ib(default=None)  # type:  Optional[AutosarSecOCProperties]
 
+    # flexray frame triggering
+    slot_id = attr.ib(default=None)  # type: typing.Optional[int]
+    base_cycle = attr.ib(default=None)  # type: typing.Optional[str]
+    repitition_cycle = attr.ib(default=None)  # type: typing.Optional[str]
+
+    # codec caches, rebuilt lazily - see _signal_layout()
+    _layout_cache = attr.ib(init=False, default=None, repr=False)  # type: typing.Optional[typing.Tuple]
+    _mux_signals_cache = attr.ib(init=False, factory=dict, repr=False)  # type: typing.MutableMapping[typing.Any, typing.List[Signal]]
+    _mux_layout_cache = attr.ib(init=False, default=None, repr=False)  # type: typing.Optional[typing.Tuple]
+    _signals_by_name = attr.ib(init=False, default=None, repr=False)  # type: typing.Optional[typing.Tuple[int, typing.Mapping[str, Signal]]]
+    # Matrix which indexes the Frame by name and id, see CanMatrix.frame_by_name
+    _matrix = attr.ib(init=False, default=None, repr=False)  # type: typing.Optional[CanMatrix]
+
+    def __setstate__(self, state):  # type: (typing.Mapping[str, typing.Any]) -> None
+        _AttrsState.__setstate__(self, state)
+        # back references are not part of the state, see Signal._frame.
+        # Signals of a shallow copy are shared with (and keep pointing to) the original Frame.
+        for signal in self.signals:
+            if signal._frame is None:
+                signal._frame = self
+
     @property
     def is_multiplexed(self):  # type: () -> bool
         """Frame is multiplexed if at least one of its signals is a multiplexer."""
@@ -1048,7 +1270,7 @@ class Frame(object):
         :param default: Default value if attribute doesn't exist.
         :return: Return the attribute value if found, else `default` or None
         """
-        if attribute_name in attr.fields_dict(type(self)):
+        if attribute_name in field_names(type(self)):
             return getattr(self, attribute_name)
         if attribute_name in self.attributes:
             return self.attributes[attribute_name]
@@ -1142,8 +1364,104 @@ class Frame(object):
         :return: the signal added.
         """
         self.signals.append(signal)
+        signal._frame = self
+        self.invalidate_caches()
         return self.signals[len(self.signals) - 1]
 
+    def invalidate_caches(self):  # type: () -> None
+        """Drop cached codec data.
+
+        Changes of the signal list or the Frame size are detected automatically, and so are edits of
+        `start_bit`, `size`, `is_little_endian`, `is_signed`, `is_float`, `mux_val` and `is_multiplexer`
+        of its signals. Call this after other in place changes, e.g. of signals shared with another Frame.
+        """
+        self._layout_cache = None
+        self._mux_signals_cache = {}
+        self._mux_layout_cache = None
+        self._signals_by_name = None
+
+    def _signal_layout(self):
+        # type: () -> typing.Sequence[typing.Tuple[Signal, bool, int, int]]
+        """Return cached bit positions of all signals, see `signal_bit_slices`.
+
+        The cache is also rebuilt if frame size or signals changed behind our back.
+        Edits of signal positions, types and multiplexing drop it via `Signal._frame`, see `_signal_layout_changed`.
+        """
+        key = (self.size, tuple(self.signals))
+        if self._layout_cache is None or self._layout_cache[0] != key:
+            for signal in self.signals:
+                if signal._frame is None:
+                    signal._frame = self
+            slices = self.signal_bit_slices(self.signals, self.size * 8)
+            compiled = self.compile_bit_slices(slices, self.size * 8)
+            structs = self.compile_struct_layout(compiled, self.size * 8) if compiled is not None else None
+            self._layout_cache = (key, slices, compiled, structs)
+            self._mux_signals_cache = {}
+            self._mux_layout_cache = None
+        return self._layout_cache[1]
+
+    def _compiled_layout(self):
+        # type: () -> typing.Optional[typing.Sequence[typing.Tuple[Signal, bool, int, int]]]
+        """Return cached shift/mask layout of all signals, see `compile_bit_slices`."""
+        self._signal_layout()
+        return self._layout_cache[2]
+
+    def _struct_layout(self):
+        # type: () -> typing.Optional[typing.Sequence[typing.Tuple[struct.Struct, struct.Struct, typing.List[int]]]]
+        """Return cached `struct` layout of all signals, see `compile_struct_layout`."""
+        self._signal_layout()
+        return self._layout_cache[3]
+
+    def _signals_for_mux_value(self, mux_value):  # type: (typing.Any) -> typing.List[Signal]
+        """Return (cached) list of signals, which are decoded/encoded for given multiplexer value."""
+        self._signal_layout()
+        signals = self._mux_signals_cache.get(mux_value)
+        if signals is None:
+            signals = [
+                signal for signal in self.signals
+                if signal.mux_val == mux_value or signal.mux_val is None
+            ]
+            self._mux_signals_cache[mux_value] = signals
+        return signals
+
+    def _compiled_mux_layout(self, mux_value):
+        # type: (typing.Any) -> typing.Sequence[typing.Tuple[Signal, bool, int, int]]
+        """Return (cached) compiled layout of the signals decoded for given multiplexer value.
+
+        Multiplexer value None returns the compiled layout of the multiplexer signal only.
+        Needs a compiled layout, see `_compiled_layout`.
+        """
+        compiled = self._compiled_layout()
+        if self._mux_layout_cache is None:
+            multiplexers = [entry for entry in compiled if entry[0].is_multiplexer]
+            # with several multiplexer signals the last one wins (as in the unpack based decoding)
+            self._mux_layout_cache = (multiplexers[-1:], {})
+        multiplexer_layout, by_value = self._mux_layout_cache
+        if mux_value is None:
+            return multiplexer_layout
+        entries = by_value.get(mux_value)
+        if entries is None:
+            selected = set(self._signals_for_mux_value(mux_value))
+            entries = [entry for entry in compiled if entry[0] in selected]
+            by_value[mux_value] = entries
+        return entries
+
+    def _decode_multiplexed(self, data):
+        # type: (bytes) -> typing.Optional[typing.Mapping[str, DecodedSignal]]
+        """Decode a (simple) multiplexed frame: the multiplexer first, then only the signals for its value.
+
+        :return: dictionary like `decode` or None if the frame has no compiled layout.
+        """
+        if self._compiled_layout() is None:
+            return None
+        multiplexer_layout = self._compiled_mux_layout(None)
+        mux_value = self.unpack_compiled(multiplexer_layout, data)[0]
+        layout = self._compiled_mux_layout(mux_value)
+        return {
+            signal.name: DecodedSignal(raw_value, signal)
+            for (signal, _, _, _), raw_value in zip(layout, self.unpack_compiled(layout, data))
+        }
+
     def add_transmitter(self, transmitter):
         # type: (str) -> None
         """Add transmitter ECU Name to Frame.
@@ -1179,11 +1497,27 @@ class Frame(object):
         :param str name: signal name to be found.
         :return: signal with given name or None if not found
         """
+        index = self._signals_by_name
+        if index is None or index[0] != len(self.signals):
+            index = self._index_signal_names()
+        signal = index[1].get(name)
+        if signal is not None and signal.name == name:
+            return signal
+        # unknown name or signals renamed in place - fall back to a scan and refresh the index
         for signal in self.signals:
             if signal.name == name:
+                self._index_signal_names()
                 return signal
         return None
 
+    def _index_signal_names(self):  # type: () -> typing.Tuple[int, typing.Mapping[str, Signal]]
+        """Rebuild name -> Signal index used by `signal_by_name`. First signal wins for duplicate names."""
+        by_name = {}  # type: typing.Dict[str, Signal]
+        for signal in self.signals:
+            by_name.setdefault(signal.name, signal)
+        self._signals_by_name = (len(self.signals), by_name)
+        return self._signals_by_name
+
     def glob_signals(self, glob_str):
         # type: (str) -> typing.Sequence[Signal]
         """Find Frame Signals by given glob pattern.
@@ -1192,11 +1526,8 @@ class Frame(object):
         :return: list of Signals by glob pattern.
         :rtype: list of Signal
         """
-        return_array = []
-        for signal in self.signals:
-            if fnmatch.fnmatchcase(signal.name, glob_str):
-                return_array.append(signal)
-        return return_array
+        match = _compiled_glob(glob_str)
+        return [signal for signal in self.signals if match(signal.name)]
 
     def add_attribute(self, attribute, value):
         # type: (str, typing.Any) -> None
@@ -1238,16 +1569,21 @@ class Frame(object):
 
         :return: Message DLC
         """
+        self.size = max(self.size, self._min_size())
+
+    def _min_size(self):  # type: () -> int
+        """Return the number of bytes needed for all Signals (and PDUs) of the Frame, see `calc_dlc`."""
         max_bit = 0
         for sig in self.signals:
-            if sig.get_startbit() + int(sig.size) > max_bit:
-                max_bit = sig.get_startbit() + int(sig.size)
+            end_bit = sig.get_startbit() + int(sig.size)
+            if end_bit > max_bit:
+                max_bit = end_bit
         max_byte = (max_bit + 7) // 8
         if self.is_pdu_container:
             max_byte *= len(self.pdus)
             for pdu in self.pdus:
                 max_byte += pdu.size
-        self.size = max(self.size, max_byte)
+        return max_byte
 
     def fit_dlc(self):
         """
@@ -1304,58 +1640,68 @@ class Frame(object):
 
         Names of dummy signals are *_Dummy_<frame.name>_<index>*
         """
-        bitfield = self.get_frame_layout()
-        startBit = -1
+        free_bits = ~self._used_bits() & ((1 << (self.size * 8)) - 1)
         sigCount = 0
-        for index, bit_signals in enumerate(bitfield):
-            if bit_signals == [] and startBit == -1:
-                startBit = index
-            if (index == (len(bitfield)-1) or bit_signals != []) and startBit != -1:
-                if index == (len(bitfield)-1):
-                    index = len(bitfield)
-                self.add_signal(Signal("_Dummy_%s_%d" % (self.name, sigCount), size=index - startBit, start_bit=startBit, is_little_endian = False))
-                startBit = -1
-                sigCount += 1
+        while free_bits:
+            # lowest free bit and the number of free bits following it
+            startBit = (free_bits & -free_bits).bit_length() - 1
+            run = free_bits >> startBit
+            size = (~run & (run + 1)).bit_length() - 1
+            self.add_signal(Signal("_Dummy_%s_%d" % (self.name, sigCount), size=size, start_bit=startBit, is_little_endian = False))
+            free_bits &= ~(((1 << size) - 1) << startBit)
+            sigCount += 1
+
+    def _used_bits(self):  # type: () -> int
+        """Return bit usage of the frame as int, bit n is set if `get_frame_layout()[n]` is not empty."""
+        size = self.size * 8
+        little = big = 0
+        for signal, is_little_endian, most, least in self._signal_layout():
+            if most < 0 or least > size or most > least:
+                # signal doesn't fit into frame, leave that to get_frame_layout
+                return sum(1 << bit for bit, bit_signals in enumerate(self.get_frame_layout()) if bit_signals)
+            mask = (1 << (least - most)) - 1
+            if is_little_endian:
+                little |= mask << (size - least)
+            else:
+                big |= mask << most
+        # little endian bits are numbered msb first inside each byte of the layout
+        little = int.from_bytes(little.to_bytes(self.size, 'little').translate(_reversed_bits), 'little')
+        return little | big
 
     def update_receiver(self):  # type: () -> None
         """
         Collect Frame receivers out of receiver given in each signal. Add them to `self.receiver` list.
         """
-        self.receivers = []
-        for sig in self.signals:
-            for receiver in sig.receivers:
-                self.add_receiver(receiver)
+        # dict keeps the order of first appearance and avoids a list scan per receiver
+        self.receivers = list(dict.fromkeys(
+            receiver for sig in self.signals for receiver in sig.receivers
+        ))
 
     def signals_to_bytes(self, data):
-        # type: (typing.Mapping[str, canmatrix.types.RawValue]) -> bytes
+        # type: (typing.Mapping[str, canmatrix.types.RawValue]) -> bytearray
         """Return a byte string containing the values from data packed
         according to the frame format.
 
         :param data: data dictionary of signal : rawValue
         :return: A byte string of the packed values.
         """
+        compiled = self._compiled_layout()
+        struct_layout = self._struct_layout()
+        if struct_layout is not None and len(struct_layout) == 1:
+            return self._pack_struct(compiled, struct_layout[0], data)
+        if compiled is not None:
+            return self._pack_compiled(compiled, data)
 
         little_bits = [None] * (self.size * 8)  # type: typing.List[typing.Optional[str]]
         big_bits = list(little_bits)
-        for signal in self.signals:
+        for signal, is_little_endian, most, least in self._signal_layout():
             if signal.name in data:
-                value = data.get(signal.name)
-                if isinstance(value, str):
-                    value = signal.phys2raw(value)
-                    if value is None:
-                        # TODO Error Handling
-                        value = 0
+                value = signal._raw_for_encoding(data.get(signal.name))
                 bits = pack_bitstring(signal.size, signal.is_float, value, signal.is_signed)
 
-                if signal.is_little_endian:
-                    least = self.size * 8 - signal.start_bit
-                    most = least - signal.size
-
+                if is_little_endian:
                     little_bits[most:least] = bits
                 else:
-                    most = signal.start_bit
-                    least = most + signal.size
-
                     big_bits[most:least] = bits
         little_bits_iter = reversed(tuple(grouper(little_bits, 8)))
         little_bits = list(itertools.chain(*little_bits_iter))
@@ -1369,6 +1715,38 @@ class Frame(object):
             for b in grouper(bitstring, 8)
         )
 
+    def _pack_struct(self, compiled, struct_layout, data):
+        # type: (typing.Sequence[typing.Tuple[Signal, bool, int, int]], typing.Tuple[struct.Struct, struct.Struct, typing.List[int]], typing.Mapping[str, canmatrix.types.RawValue]) -> bytearray
+        """Pack data like `signals_to_bytes` for frames with byte aligned signals of one byte order only."""
+        _, packer, indices = struct_layout
+        values = []
+        for index in indices:
+            signal = compiled[index][0]
+            value = signal._raw_for_encoding(data.get(signal.name, 0))
+            values.append(pack_int(signal.size, signal.is_float, value, signal.is_signed))
+        packed = bytearray(self.size)
+        packer.pack_into(packed, 0, *values)
+        return packed
+
+    def _pack_compiled(self, compiled, data):
+        # type: (typing.Iterable[typing.Tuple[Signal, bool, int, int]], typing.Mapping[str, canmatrix.types.RawValue]) -> bytearray
+        """Pack data like `signals_to_bytes`, using the shift/mask layout (see `compile_bit_slices`)."""
+        little = little_used = big = 0
+        for signal, is_little_endian, shift, mask in compiled:
+            if signal.name in data:
+                value = signal._raw_for_encoding(data.get(signal.name))
+                bits = pack_int(signal.size, signal.is_float, value, signal.is_signed)
+                # later signals overwrite earlier ones on overlapping bits
+                if is_little_endian:
+                    little = (little & ~(mask << shift)) | (bits << shift)
+                    little_used |= mask << shift
+                else:
+                    big = (big & ~(mask << shift)) | (bits << shift)
+        # little endian signals take precedence over big endian ones
+        little = int.from_bytes(little.to_bytes(self.size, 'little'), 'big')
+        little_used = int.from_bytes(little_used.to_bytes(self.size, 'little'), 'big')
+        return bytearray((little | (big & ~little_used)).to_bytes(self.size, 'big'))
+
     def encode(self, data=None):
         # type: (typing.Optional[typing.Mapping[str, typing.Any]]) -> bytes
         """Return a byte string containing the values from data packed
@@ -1393,10 +1771,8 @@ class Frame(object):
             else:
                 raise MissingMuxSignal
             # create list of signals which belong to muxgroup
-            encodeSignals = [muxSignal.name]
-            for signal in self.signals:
-                if signal.mux_val == muxVal or signal.mux_val is None:
-                    encodeSignals.append(signal.name)
+            encodeSignals = {muxSignal.name}
+            encodeSignals.update(signal.name for signal in self._signals_for_mux_value(muxVal))
             newData = dict()
             # kick out signals, which do not belong to this mux-id
             for signalName in data:
@@ -1414,51 +1790,170 @@ class Frame(object):
             i.e. bytearray([0xA1, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7, 0xA8])
         :return: bit arrays in big and little byteorder
         """
-        b = tuple('{:08b}'.format(b) for b in data)
-        little = ''.join(reversed(b))
-        big = ''.join(b)
+        data = bytes(data)
+        size = len(data) * 8
+        # one integer formatted per byte order instead of one string per byte
+        little = '{:0{}b}'.format(int.from_bytes(data, 'little'), size) if size else ''
+        big = '{:0{}b}'.format(int.from_bytes(data, 'big'), size) if size else ''
 
         return little, big
 
     @staticmethod
-    def bitstring_to_signal_list(signals, big, little, size):
-        # type: (typing.Sequence[Signal], str, str, int) -> typing.Sequence[canmatrix.types.RawValue]
-        """Return OrderedDictionary with Signal Name: object decodedSignal (flat / without support for multiplexed frames)
+    def signal_bit_slices(signals, size):
+        # type: (typing.Iterable[Signal], int) -> typing.List[typing.Tuple[Signal, bool, int, int]]
+        """Return the position of every signal in the bitstrings of `bytes_to_bitstrings`.
 
-        :param signals: Iterable of signals (class signal) to decode from frame.
-        :param big: bytearray of bits (big endian).
-        :param little: bytearray of bits (little endian).
+        :param signals: Iterable of signals (class signal).
         :param size: number of bits.
-        :return: array with raw values (same order like signals)
+        :return: list of tuples (signal, is_little_endian, most, least), bits are `bitstring[most:least]`
         """
-        unpacked = []
+        slices = []
         for signal in signals:
             if signal.is_little_endian:
                 least = size - signal.start_bit
                 most = least - signal.size
-
-                bits = little[most:least]
             else:
                 most = signal.start_bit
                 least = most + signal.size
+            slices.append((signal, signal.is_little_endian, most, least))
+        return slices
+
+    @staticmethod
+    def unpack_bit_slices(slices, big, little):
+        # type: (typing.Iterable[typing.Tuple[Signal, bool, int, int]], str, str) -> typing.List[canmatrix.types.RawValue]
+        """Return raw values of signals at given positions (see `signal_bit_slices`).
+
+        :param slices: signal positions
+        :param big: bytearray of bits (big endian).
+        :param little: bytearray of bits (little endian).
+        :return: array with raw values (same order like slices)
+        """
+        return [
+            unpack_bitstring(
+                signal.size, signal.is_float, signal.is_signed,
+                little[most:least] if is_little_endian else big[most:least]
+            )
+            for signal, is_little_endian, most, least in slices
+        ]
+
+    @staticmethod
+    def compile_bit_slices(slices, size):
+        # type: (typing.Iterable[typing.Tuple[Signal, bool, int, int]], int) -> typing.Optional[typing.List[typing.Tuple[Signal, bool, int, int]]]
+        """Translate bitstring slices (see `signal_bit_slices`) to shifts and masks on the frame data as integer.
+
+        The signal is `(int.from_bytes(data, byteorder) >> shift) & mask`.
+
+        :param slices: signal positions
+        :param size: number of bits.
+        :return: list of tuples (signal, is_little_endian, shift, mask) or None if any signal exceeds the frame
+            or has no integer representation.
+        """
+        compiled = []
+        for signal, is_little_endian, most, least in slices:
+            if most < 0 or least > size or signal.size <= 0:
+                return None
+            if signal.is_float and signal.size not in _float_structs:
+                return None
+            compiled.append((signal, is_little_endian, size - least, (1 << signal.size) - 1))
+        return compiled
 
-                bits = big[most:least]
+    @staticmethod
+    def compile_struct_layout(compiled, size):
+        # type: (typing.Sequence[typing.Tuple[Signal, bool, int, int]], int) -> typing.Optional[typing.List[typing.Tuple[struct.Struct, struct.Struct, typing.List[int]]]]
+        """Translate a compiled layout (see `compile_bit_slices`) to `struct` formats.
+
+        This only works if every signal is byte aligned and 8, 16, 32 or 64 bit wide (common for J1939).
+        There is one format per byte order, signals of the same byte order must not overlap.
+
+        :param compiled: compiled signal positions
+        :param size: number of bits.
+        :return: list of tuples (unpack struct, pack struct, indices of the signals in compiled) or None
+        """
+        fields = {True: [], False: []}  # type: typing.Dict[bool, typing.List[typing.Tuple[int, int, Signal]]]
+        for index, (signal, is_little_endian, shift, _) in enumerate(compiled):
+            if shift % 8 or signal.size not in _struct_codes[(False, False)]:
+                return None
+            offset = shift if is_little_endian else size - shift - signal.size
+            fields[is_little_endian].append((offset // 8, index, signal))
+        layout = []
+        for is_little_endian, entries in fields.items():
+            if not entries:
+                continue
+            entries.sort(key=lambda entry: entry[0])
+            unpack_format = pack_format = '<' if is_little_endian else '>'
+            position = 0
+            for offset, _, signal in entries:
+                if offset < position:
+                    return None
+                padding = '{}x'.format(offset - position) if offset > position else ''
+                unpack_format += padding + _struct_codes[(signal.is_float, signal.is_signed)][signal.size]
+                pack_format += padding + _struct_codes[(False, False)][signal.size]
+                position = offset + signal.size // 8
+            layout.append((struct.Struct(unpack_format), struct.Struct(pack_format), [entry[1] for entry in entries]))
+        return layout
+
+    @staticmethod
+    def unpack_struct_layout(struct_layout, data, count):
+        # type: (typing.Iterable[typing.Tuple[struct.Struct, struct.Struct, typing.List[int]]], bytes, int) -> typing.List[canmatrix.types.RawValue]
+        """Return raw values of signals with a struct layout (see `compile_struct_layout`).
+
+        :param struct_layout: struct layout
+        :param data: bytearray or Iterable of ints
+        :param count: number of signals in the layout
+        :return: array with raw values (same order like the compiled layout)
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            # struct needs a buffer, i.e. for tuples like (0xA1, 0xA2)
+            data = bytes(data)
+        values = [None] * count  # type: typing.List[typing.Any]
+        for unpacker, _, indices in struct_layout:
+            for index, value in zip(indices, unpacker.unpack_from(data)):
+                values[index] = value
+        return values
+
+    @staticmethod
+    def unpack_compiled(compiled, data):
+        # type: (typing.Iterable[typing.Tuple[Signal, bool, int, int]], typing.Iterable[int]) -> typing.List[canmatrix.types.RawValue]
+        """Return raw values of signals at given shifts/masks (see `compile_bit_slices`).
 
-            unpacked.append(unpack_bitstring(signal.size, signal.is_float, signal.is_signed, bits))
+        :param compiled: compiled signal positions
+        :param data: bytearray
+        :return: array with raw values (same order like compiled)
+        """
+        little = int.from_bytes(data, 'little')
+        big = int.from_bytes(data, 'big')
+        return [
+            unpack_int(
+                signal.size, signal.is_float, signal.is_signed,
+                ((little if is_little_endian else big) >> shift) & mask
+            )
+            for signal, is_little_endian, shift, mask in compiled
+        ]
 
-        return unpacked
+    @staticmethod
+    def bitstring_to_signal_list(signals, big, little, size):
+        # type: (typing.Sequence[Signal], str, str, int) -> typing.Sequence[canmatrix.types.RawValue]
+        """Return dictionary with Signal Name: object decodedSignal (flat / without support for multiplexed frames)
+
+        :param signals: Iterable of signals (class signal) to decode from frame.
+        :param big: bytearray of bits (big endian).
+        :param little: bytearray of bits (little endian).
+        :param size: number of bits.
+        :return: array with raw values (same order like signals)
+        """
+        return Frame.unpack_bit_slices(Frame.signal_bit_slices(signals, size), big, little)
 
     def unpack(self, data: bytes,
                allow_truncated: bool = False,
                allow_exceeded: bool = False,
                ) -> typing.Mapping[str, DecodedSignal]:
-        """Return OrderedDictionary with Signal Name: object decodedSignal (flat / without support for multiplexed frames)
+        """Return dictionary with Signal Name: object decodedSignal (flat / without support for multiplexed frames)
         decodes every signal in signal-list.
 
         :param data: bytearray
             i.e. bytearray([0xA1, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7, 0xA8])
         :param report_error: set to False to silence error output
-        :return: OrderedDictionary
+        :return: dictionary
         """
 
         rx_length = len(data)
@@ -1534,17 +2029,78 @@ class Frame(object):
                 offset += (pdu_dlc * 8)
             return return_dict
         else:
-            little, big = self.bytes_to_bitstrings(data)
-
-            unpacked = self.bitstring_to_signal_list(self.signals, big, little, self.size * 8)
+            layout = self._compiled_layout()
+            struct_layout = self._struct_layout()
+            if struct_layout is not None:
+                unpacked = self.unpack_struct_layout(struct_layout, data, len(layout))
+            elif layout is not None:
+                unpacked = self.unpack_compiled(layout, data)
+            else:
+                little, big = self.bytes_to_bitstrings(data)
+                layout = self._signal_layout()
+                unpacked = self.unpack_bit_slices(layout, big, little)
 
             return_dict = dict()
 
-            for s, v in zip(self.signals, unpacked):
+            for (s, _, _, _), v in zip(layout, unpacked):
                 return_dict[s.name] = DecodedSignal(v, s)
 
             return return_dict
 
+    def decode_many(self, data_list):
+        # type: (typing.Iterable[bytes]) -> typing.Mapping[str, typing.List[float]]
+        """Decode a batch of payloads of this Frame (flat, without multiplexer or PDU handling).
+
+        Physical values are calculated with float instead of `decimal`,
+        which is much faster than calling `decode` for every payload.
+
+        :param data_list: Iterable of bytearrays, each with frame size
+            i.e. [bytearray([0xA1, 0xA2]), bytearray([0xB1, 0xB2])]
+        :return: dictionary with Signal Name: list of physical values (same order like data_list)
+        """
+        layout = self._compiled_layout()
+        struct_layout = self._struct_layout()
+        signals = [s for s, _, _, _ in layout] if layout is not None else self.signals
+        scaling = [(float(s.factor), float(s.offset)) for s in signals]
+        if struct_layout is None and layout is not None and not any(s.is_float for s in signals):
+            return {s.name: column for s, column in zip(signals, self._decode_many_int(layout, scaling, data_list))}
+        columns = [[] for _ in signals]  # type: typing.List[typing.List[float]]
+        for data in data_list:
+            if len(data) != self.size:
+                raise DecodingFrameLength(
+                    "Received message with wrong data size: {} instead of {}".format(len(data), self.size))
+            if struct_layout is not None:
+                unpacked = self.unpack_struct_layout(struct_layout, data, len(layout))
+            elif layout is not None:
+                unpacked = self.unpack_compiled(layout, data)
+            else:
+                little, big = self.bytes_to_bitstrings(data)
+                unpacked = self.unpack_bit_slices(self._signal_layout(), big, little)
+            for column, (factor, offset), raw_value in zip(columns, scaling, unpacked):
+                column.append(raw_value * factor + offset)
+        return {s.name: column for s, column in zip(signals, columns)}
+
+    def _decode_many_int(self, compiled, scaling, data_list):
+        # type: (typing.Sequence[typing.Tuple[Signal, bool, int, int]], typing.Sequence[typing.Tuple[float, float]], typing.Iterable[bytes]) -> typing.List[typing.List[float]]
+        """Inner loop of `decode_many` for integer signals, with shift, mask, sign and scaling inlined."""
+        plan = [
+            (is_little_endian, shift, mask, (mask >> 1) + 1 if signal.is_signed else 0, mask + 1, factor, offset)
+            for (signal, is_little_endian, shift, mask), (factor, offset) in zip(compiled, scaling)
+        ]
+        columns = [[] for _ in plan]  # type: typing.List[typing.List[float]]
+        for data in data_list:
+            if len(data) != self.size:
+                raise DecodingFrameLength(
+                    "Received message with wrong data size: {} instead of {}".format(len(data), self.size))
+            little = int.from_bytes(data, 'little')
+            big = int.from_bytes(data, 'big')
+            for column, (is_little_endian, shift, mask, sign_bit, span, factor, offset) in zip(columns, plan):
+                raw_value = ((little if is_little_endian else big) >> shift) & mask
+                if raw_value & sign_bit:
+                    raw_value -= span
+                column.append(raw_value * factor + offset)
+        return columns
+
     def _get_sub_multiplexer(self, parent_multiplexer_name, parent_multiplexer_value):
         """
         get any sub-multiplexer in frame used
@@ -1578,16 +2134,23 @@ class Frame(object):
 
     def decode(self, data):
         # type: (bytes) -> typing.Mapping[str, typing.Any]
-        """Return OrderedDictionary with Signal Name: object decodedSignal (support for multiplexed frames)
+        """Return dictionary with Signal Name: object decodedSignal (support for multiplexed frames)
         decodes only signals matching to muxgroup
 
         :param data: bytearray .
             i.e. bytearray([0xA1, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7, 0xA8])
-        :return: OrderedDictionary
+        :return: dictionary
         """
+        is_complex_multiplexed = self.is_complex_multiplexed
+        if (not is_complex_multiplexed and len(data) == self.size
+                and self.is_multiplexed and not self.is_pdu_container):
+            decoded_values = self._decode_multiplexed(data)
+            if decoded_values is not None:
+                return decoded_values
+
         decoded = self.unpack(data)
 
-        if self.is_complex_multiplexed:
+        if is_complex_multiplexed:
             decoded_values = dict()
             filtered_signals = self._filter_signals_for_multiplexer(None, None)
 
@@ -1616,9 +2179,8 @@ class Frame(object):
                     muxVal = decoded[signal.name].raw_value
 
             # find all signals with the identified multiplexer-value
-            for signal in self.signals:
-                if signal.mux_val == muxVal or signal.mux_val is None:
-                    decoded_values[signal.name] = decoded[signal.name]
+            for signal in self._signals_for_mux_value(muxVal):
+                decoded_values[signal.name] = decoded[signal.name]
             return decoded_values
 
         else:
@@ -1646,6 +2208,7 @@ class Frame(object):
                         if gap_len is not None:
                             signal = layout[bit_nr][0]
                             signal.start_bit -= gap_len
+                            self.invalidate_caches()
                             gap_found = True
                             break
                 if gap_found:
@@ -1668,6 +2231,7 @@ class Frame(object):
                     if free_start is not None:
                         signal = layout[bit_nr][0]
                         signal.start_bit = free_start
+                        self.invalidate_caches()
                         gap_found = True
                         break
 
@@ -1682,12 +2246,52 @@ class Frame(object):
                 continue
             signal.muxer_for_signal = multiplexor.name
             signal.mux_val = signal.multiplex
+        self.invalidate_caches()
 
     def __str__(self):  # type: () -> str
         """Represent the frame by its name only."""
         return self.name  # add more details than the name only?
 
 
+def safe_convert_str_to_int(inStr):  # type: (str) -> int
+    """Convert string to int safely. Check that it isn't float.
+
+    :param str inStr: integer represented as string.
+    :rtype: int
+    """
+    value = defaultFloatFactory(inStr)
+    out = int(value)
+    if out != value:
+        logger.warning("Warning, integer was expected but got float: got: {0} using {1}\n".format(inStr, str(out)))
+    return out
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_define(definition):
+    # type: (str) -> typing.Tuple[typing.Optional[str], typing.Tuple[str, ...], typing.Tuple[str, ...]]
+    """Split a (stripped) define definition string, see `Define`.
+
+    Cached, as many defines share the same definition (i.e. "INT 0 255").
+    Only the string parsing is cached: the bounds are converted (and checked) by `Define` for every define.
+
+    :return: tuple (type, (min, max) strings of INT, HEX and FLOAT, ENUM values)
+    """
+    kind, _, arguments = definition.partition(' ')
+    # HEX is differently rendered in DBC editor, but values are saved like for an INT
+    if kind == 'INT' or kind == 'HEX' or kind == 'FLOAT':
+        min, max = arguments.split(' ', 2)
+        return kind, (min, max), ()
+    elif kind == 'STRING':
+        return kind, (), ()
+    elif kind == 'ENUM':
+        values = tuple(
+            value.replace("vector_leerstring", "")
+            for value in canmatrix.utils.quote_aware_comma_split(arguments)
+        )
+        return kind, (), values
+    return None, (), ()
+
+
 class Define(object):
     """
     Hold the defines and default-values.
@@ -1700,58 +2304,24 @@ class Define(object):
         """
         definition = definition.strip()
         self.definition = definition
-        self.type = None  # type: typing.Optional[str]
         self.defaultValue = None  # type: typing.Any
 
-        def safe_convert_str_to_int(inStr):  # type: (str) -> int
-            """Convert string to int safely. Check that it isn't float.
-
-            :param str inStr: integer represented as string.
-            :rtype: int
-            """
-            out = int(defaultFloatFactory(inStr))
-            if out != defaultFloatFactory(inStr):
-                logger.warning("Warning, integer was expected but got float: got: {0} using {1}\n".format(inStr, str(out)))
-            return out
-
-        # for any known type:
-        if definition[0:3] == 'INT':
-            self.type = 'INT'
-            min, max = definition[4:].split(' ', 2)
-            self.min = safe_convert_str_to_int(min)
-            self.max = safe_convert_str_to_int(max)
-
-        elif definition[0:6] == 'STRING':
-            self.type = 'STRING'
-            self.min = None
-            self.max = None
-
-        elif definition[0:4] == 'ENUM':
-            self.type = 'ENUM'
-            tempValues = canmatrix.utils.quote_aware_comma_split(definition[5:])
-            self.values = []  # type: typing.List[str]
-            for value in tempValues:
-                value = value.replace("vector_leerstring", "")
-                self.values.append(value)
-
-        elif definition[0:3] == 'HEX':  # differently rendered in DBC editor, but values are saved like for an INT
-            self.type = 'HEX'
-            min, max = definition[4:].split(' ', 2)
-            self.min = safe_convert_str_to_int(min)
-            self.max = safe_convert_str_to_int(max)
-
-        elif definition[0:5] == 'FLOAT':
-            self.type = 'FLOAT'
-            min, max = definition[6:].split(' ', 2)
-            self.min = defaultFloatFactory(min)
-            self.max = defaultFloatFactory(max)
+        self.type, bounds, values = _parse_define(definition)
+        if self.type == 'INT' or self.type == 'HEX':
+            self.min, self.max = safe_convert_str_to_int(bounds[0]), safe_convert_str_to_int(bounds[1])
+        elif self.type == 'FLOAT':
+            self.min, self.max = defaultFloatFactory(bounds[0]), defaultFloatFactory(bounds[1])
+        elif self.type == 'STRING':
+            self.min, self.max = None, None
+        elif self.type == 'ENUM':
+            self.values = list(values)  # type: typing.List[str]
 
     def set_default(self, default):  # type: (typing.Any) -> None
         """Set Definition default value.
 
         :param default: default value; number, str or quoted str ("value")
         """
-        if default is not None and len(default) > 1 and default[0] == '"' and default[-1] == '"':
+        if isinstance(default, str) and len(default) > 1 and default.startswith('"') and default.endswith('"'):
             default = default[1:-1]
         self.defaultValue = default
 
@@ -1773,7 +2343,7 @@ class matrix_class(enum.Enum):
     SOMEIP = 3
 
 @attr.s(eq=False)
-class CanMatrix(object):
+class CanMatrix(_AttrsState):
     """
     The Can-Matrix-Object
     attributes (global canmatrix-attributes),
@@ -1786,6 +2356,8 @@ class CanMatrix(object):
     value_tables (global defined values)
     """
 
+    _transient_fields = ("_frames_by_name", "_frames_by_id", "_ecus_by_name")
+
     type = attr.ib(default=matrix_class.CAN)  #type: matrix_class
     attributes = attr.ib(factory=dict)  # type: typing.MutableMapping[str, typing.Any]
     ecus = attr.ib(factory=list)  # type: typing.MutableSequence[Ecu]
@@ -1807,6 +2379,11 @@ class CanMatrix(object):
     vlan = attr.ib(default=None)  # type:int
     load_errors = attr.ib(factory=list)  # type: typing.MutableSequence[Exception]
 
+    # lookup indices of frames and ecus, rebuilt lazily - see _index()
+    _frames_by_name = attr.ib(init=False, default=None, repr=False)  # type: typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]]
+    _frames_by_id = attr.ib(init=False, default=None, repr=False)  # type: typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]]
+    _ecus_by_name = attr.ib(init=False, default=None, repr=False)  # type: typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]]
+
     def __iter__(self):  # type: () -> typing.Iterator[Frame]
         """Matrix iterates over Frames (Messages)."""
         return iter(self.frames)
@@ -1823,18 +2400,14 @@ class CanMatrix(object):
 
     @property
     def contains_fd(self):  # type: () -> bool
-        for frame in self.frames:
-            if frame.is_fd:
-                return True
-        return False
+        """Check whether the Matrix contains any CAN-FD Frame."""
+        # no cached counter: is_fd is set directly on frames by importers and set_fd_type
+        return any(frame.is_fd for frame in self.frames)
 
     @property
     def contains_j1939(self):  # type: () -> bool
         """Check whether the Matrix contains any J1939 Frame."""
-        for frame in self.frames:
-            if frame.is_j1939:
-                return True
-        return False
+        return any(frame.is_j1939 for frame in self.frames)
 
     def attribute(self, attributeName, default=None):  # type(str, typing.Any) -> typing.Any
         """Return custom Matrix attribute by name.
@@ -1936,10 +2509,10 @@ class CanMatrix(object):
     def delete_obsolete_ecus(self):  # type: () -> None
         """Delete all unused ECUs
         """
-        used_ecus = [ecu for f in self.frames for ecu in f.transmitters]
-        used_ecus += [ecu for f in self.frames for ecu in f.receivers]
-        used_ecus += [ecu for f in self.frames for s in f.signals for ecu in s.receivers]
-        used_ecus += [ecu for s in self.signals for ecu in s.receivers]
+        used_ecus = {ecu for f in self.frames for ecu in f.transmitters}
+        used_ecus.update(ecu for f in self.frames for ecu in f.receivers)
+        used_ecus.update(ecu for f in self.frames for s in f.signals for ecu in s.receivers)
+        used_ecus.update(ecu for s in self.signals for ecu in s.receivers)
         ecus_to_delete = [ecu.name for ecu in self.ecus if ecu.name not in used_ecus]
         for ecu in ecus_to_delete:
             self.del_ecu(ecu)
@@ -1949,35 +2522,102 @@ class CanMatrix(object):
 
         Delete them from frame_defines, ecu_defines and signal_defines.
         """
-        defines_to_delete = set()  # type: typing.Set[str]
-        for frameDef in self.frame_defines:
-            for frame in self.frames:
-                if frameDef in frame.attributes:
-                    break
-            else:
-                defines_to_delete.add(frameDef)
-        for element in defines_to_delete:
-            del self.frame_defines[element]
-        defines_to_delete = set()
-        for ecu_define in self.ecu_defines:
-            for ecu in self.ecus:
-                if ecu_define in ecu.attributes:
-                    break
-            else:
-                defines_to_delete.add(ecu_define)
-        for element in defines_to_delete:
-            del self.ecu_defines[element]
+        used_frame_attributes = set()  # type: typing.Set[str]
+        used_signal_attributes = set()  # type: typing.Set[str]
+        for frame in self.frames:
+            used_frame_attributes.update(frame.attributes)
+            for signal in frame.signals:
+                used_signal_attributes.update(signal.attributes)
+        used_ecu_attributes = set()  # type: typing.Set[str]
+        for ecu in self.ecus:
+            used_ecu_attributes.update(ecu.attributes)
+
+        for defines, used_attributes in (
+                (self.frame_defines, used_frame_attributes),
+                (self.ecu_defines, used_ecu_attributes),
+                (self.signal_defines, used_signal_attributes)):
+            for element in [define for define in defines if define not in used_attributes]:
+                del defines[element]
 
-        defines_to_delete = set()
-        for signal_define in self.signal_defines:
-            for frame in self.frames:
-                for signal in frame.signals:
-                    if signal_define in signal.attributes:
-                        break
-                else:
-                    defines_to_delete.add(signal_define)
-        for element in defines_to_delete:
-            del self.signal_defines[element]
+    @staticmethod
+    def _index(index, items, key, link):
+        # type: (typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]], typing.Sequence, typing.Callable, typing.Callable) -> typing.Tuple[int, typing.Dict[typing.Any, typing.List]]
+        """Return index (dict key -> list of items, in list order) of items, rebuilt if dropped or items changed in length.
+
+        `link` is called for every item of a rebuilt index, it sets the back references
+        which let in place edits of the keys drop the index (see `_frame_name_changed`).
+        """
+        if index is None or index[0] != len(items):
+            by_key = {}  # type: typing.Dict[typing.Any, typing.List]
+            for item in items:
+                link(item)
+                by_key.setdefault(key(item), []).append(item)
+            return len(items), by_key
+        return index
+
+    @staticmethod
+    def _index_add(index, length, key, item):  # type: (typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]], int, typing.Any, typing.Any) -> typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]]
+        """Add item appended to `length` items to the index, if the index was up to date before. Else drop it."""
+        if index is None or index[0] != length:
+            return None
+        index[1].setdefault(key, []).append(item)
+        return length + 1, index[1]
+
+    @staticmethod
+    def _index_remove(index, length, key, item):  # type: (typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]], int, typing.Any, typing.Any) -> typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]]
+        """Remove item (its first occurrence) from `length` items from the index, if the index is up to date. Else drop it."""
+        if index is None or index[0] != length:
+            return None
+        bucket = index[1].get(key, [])
+        position = next((i for i, test in enumerate(bucket) if test == item), None)
+        if position is None:
+            return None
+        del bucket[position]
+        if not bucket:
+            del index[1][key]
+        return length - 1, index[1]
+
+    @staticmethod
+    def _index_move(index, length, old_key, new_key, item):  # type: (typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]], int, typing.Any, typing.Any, typing.Any) -> typing.Optional[typing.Tuple[int, typing.Dict[typing.Any, typing.List]]]
+        """Move item, whose key was just edited, to its new key in the index, if it was up to date before. Else drop it."""
+        if index is None or index[0] != length:
+            return None
+        by_key = index[1]
+        if old_key != new_key:
+            bucket = by_key.get(old_key, [])
+            position = next((i for i, test in enumerate(bucket) if test is item), None)
+            if position is None or new_key in by_key:
+                # new key is taken: list order of the items with that key is unknown here
+                return None
+            del bucket[position]
+            if not bucket:
+                del by_key[old_key]
+            by_key[new_key] = [item]
+        return index
+
+    def _link_frame(self, frame):  # type: (Frame) -> None
+        """Let in place edits of name and id of frame drop the indices of this Matrix, unless another Matrix indexes it."""
+        if frame._matrix is None:
+            frame._matrix = self
+        if frame.arbitration_id._frame is None:
+            frame.arbitration_id._frame = frame
+
+    def _link_ecu(self, ecu):  # type: (Ecu) -> None
+        """Let in place edits of the name of ecu drop the index of this Matrix, unless another Matrix indexes it."""
+        if ecu._matrix is None:
+            ecu._matrix = self
+
+    def invalidate_indices(self):  # type: () -> None
+        """Drop lookup indices of frames and ECUs, see `frame_by_id`, `frame_by_name` and `ecu_by_name`.
+
+        The indices follow `add_frame`, `remove_frame`, `del_frame`, `rename_frame`, `add_ecu`, `rename_ecu` and `del_ecu`,
+        appended or removed list items and in place edits of the names and ids of Frames and ECUs.
+        Call this after other in place changes of `frames` or `ecus`, e.g. replacing items by index or sorting,
+        and after editing names or ids of Frames or ECUs, which were added to another Matrix, too.
+        """
+        self._frames_by_name = None
+        self._frames_by_id = None
+        self._ecus_by_name = None
 
     def frame_by_id(self, arbitration_id):  # type: (ArbitrationId) -> typing.Union[Frame, None]
         """Get Frame by its arbitration id.
@@ -1985,9 +2625,9 @@ class CanMatrix(object):
         :param ArbitrationId arbitration_id: Frame id as canmatrix.ArbitrationId
         :rtype: Frame or None
         """
-        for test in self.frames:
+        self._frames_by_id = self._index(self._frames_by_id, self.frames, lambda frame: frame.arbitration_id.id, self._link_frame)
+        for test in self._frames_by_id[1].get(arbitration_id.id, ()):
             if test.arbitration_id == arbitration_id:
-                # found ID while ignoring extended or standard
                 return test
         return None
 
@@ -2018,11 +2658,11 @@ class CanMatrix(object):
         :param int pgn: pgn to search for
         :rtype: Frame or None
         """
-
+        # canmatrix.ArbitrationId.from_pgn(pgn).pgn instead
+        # of just pgn is needed to do the pf >= 240 check
+        pgn = canmatrix.ArbitrationId.from_pgn(pgn).pgn
         for test in self.frames:
-            if test.arbitration_id.pgn == canmatrix.ArbitrationId.from_pgn(pgn).pgn:
-                # canmatrix.ArbitrationId.from_pgn(pgn).pgn instead
-                # of just pgn is needed to do the pf >= 240 check
+            if test.arbitration_id.pgn == pgn:
                 return test
         return None
 
@@ -2032,10 +2672,9 @@ class CanMatrix(object):
         :param str name: Frame name to search for
         :rtype: Frame or None
         """
-        for test in self.frames:
-            if test.name == name:
-                return test
-        return None
+        self._frames_by_name = self._index(self._frames_by_name, self.frames, lambda frame: frame.name, self._link_frame)
+        frames = self._frames_by_name[1].get(name)
+        return frames[0] if frames else None
 
     def get_frame_by_name(self, name):  # type: (str) -> typing.Union[Frame, None]
         """Get Frame by name.
@@ -2052,11 +2691,8 @@ class CanMatrix(object):
         :param str globStr: glob pattern to filter Frames. See `fnmatch.fnmatchcase`.
         :rtype: list of Frame
         """
-        return_array = []
-        for test in self.frames:
-            if fnmatch.fnmatchcase(test.name, globStr):
-                return_array.append(test)
-        return return_array
+        match = _compiled_glob(globStr)
+        return [test for test in self.frames if match(test.name)]
 
     def ecu_by_name(self, name):  # type: (str) -> typing.Union[Ecu, None]
         """
@@ -2065,10 +2701,9 @@ class CanMatrix(object):
         :param str name: BoardUnit name
         :rtype: Ecu or None
         """
-        for test in self.ecus:
-            if test.name == name:
-                return test
-        return None
+        self._ecus_by_name = self._index(self._ecus_by_name, self.ecus, lambda ecu: ecu.name, self._link_ecu)
+        ecus = self._ecus_by_name[1].get(name)
+        return ecus[0] if ecus else None
 
     def glob_ecus(self, globStr):  # type: (str) -> typing.List[Ecu]
         """
@@ -2077,11 +2712,8 @@ class CanMatrix(object):
         :param globStr: glob pattern to filter BoardUnits. See `fnmatch.fnmatchcase`.
         :rtype: list of Ecu
         """
-        return_array = []
-        for test in self.ecus:
-            if fnmatch.fnmatchcase(test.name, globStr):
-                return_array.append(test)
-        return return_array
+        match = _compiled_glob(globStr)
+        return [test for test in self.ecus if match(test.name)]
 
     def add_frame(self, frame):  # type: (Frame) -> Frame
         """Add the Frame to the Matrix.
@@ -2089,7 +2721,12 @@ class CanMatrix(object):
         :param Frame frame: Frame to add
         :return: the inserted Frame
         """
+        length = len(self.frames)
         self.frames.append(frame)
+        frame._matrix = frame.arbitration_id._frame = None
+        self._link_frame(frame)
+        self._frames_by_name = self._index_add(self._frames_by_name, length, frame.name, frame)
+        self._frames_by_id = self._index_add(self._frames_by_id, length, frame.arbitration_id.id, frame)
 
         self.frames_dict_name[frame.name] = frame
         if frame.header_id:
@@ -2104,7 +2741,12 @@ class CanMatrix(object):
 
         :param Frame frame: frame to remove from CAN Matrix
         """
+        length = len(self.frames)
         self.frames.remove(frame)
+        self._frames_by_name = self._index_remove(self._frames_by_name, length, frame.name, frame)
+        self._frames_by_id = self._index_remove(self._frames_by_id, length, frame.arbitration_id.id, frame)
+        if frame._matrix is self:
+            frame._matrix = None
 
     def add_signal(self, signal):  # type: (Signal) -> Signal
         """
@@ -2126,9 +2768,10 @@ class CanMatrix(object):
     def delete_zero_signals(self):  # type: () -> None
         """Delete all signals with zero bit width from all Frames."""
         for frame in self.frames:
-            for signal in frame.signals:
-                if 0 == signal.size:
-                    frame.signals.remove(signal)
+            signals = [signal for signal in frame.signals if signal.size != 0]
+            if len(signals) != len(frame.signals):
+                frame.signals[:] = signals
+                frame.invalidate_caches()
 
     def del_signal_attributes(self, unwanted_attributes):  # type: (typing.Sequence[str]) -> None
         """Delete Signal attributes from all Signals of all Frames.
@@ -2154,20 +2797,12 @@ class CanMatrix(object):
 
         :param str strategy: selected strategy, "max" or "force".
         """
-        for frame in self.frames:
-            if "max" == strategy:
+        if "max" == strategy:
+            for frame in self.frames:
                 frame.calc_dlc()
-            if "force" == strategy:
-                maxBit = 0
-                for sig in frame.signals:
-                    if sig.get_startbit() + int(sig.size) > maxBit:
-                        maxBit = sig.get_startbit() + int(sig.size)
-                max_byte = (maxBit + 7) // 8
-                if frame.is_pdu_container:
-                    max_byte *= len(frame.pdus)
-                    for pdu in self.pdus:
-                        max_byte += pdu.size
-                frame.size = max_byte
+        elif "force" == strategy:
+            for frame in self.frames:
+                frame.size = frame._min_size()
 
     def rename_ecu(self, ecu_or_name, new_name):  # type: (typing.Union[Ecu, str], str) -> None
         """Rename ECU in the Matrix. Update references in all Frames.
@@ -2179,26 +2814,34 @@ class CanMatrix(object):
         if ecu is None:
             return
         old_name = ecu.name
+        index = self._ecus_by_name
         ecu.name = new_name
+        self._ecus_by_name = self._index_move(index, len(self.ecus), old_name, new_name, ecu)
         for frame in self.frames:
             if old_name in frame.transmitters:
                 frame.transmitters.remove(old_name)
                 frame.add_transmitter(new_name)
+            touched = old_name in frame.receivers
             for signal in frame.signals:
                 if old_name in signal.receivers:
                     signal.receivers.remove(old_name)
                     signal.add_receiver(new_name)
-            frame.update_receiver()
+                    touched = True
+            if touched:
+                frame.update_receiver()
 
     def add_ecu(self, ecu):  # type(Ecu) -> None  # todo return Ecu?
         """Add new ECU to the Matrix. Do nothing if ecu with the same name already exists.
 
         :param Ecu ecu: ECU name to add
         """
-        for bu in self.ecus:
-            if bu.name.strip() == ecu.name:
-                return
+        if self.ecu_by_name(ecu.name) is not None:
+            return
+        length = len(self.ecus)
         self.ecus.append(ecu)
+        ecu._matrix = None
+        self._link_ecu(ecu)
+        self._ecus_by_name = self._index_add(self._ecus_by_name, length, ecu.name, ecu)
 
     def del_ecu(self, ecu_or_glob):  # type: (typing.Union[Ecu, str]) -> None
         """Remove ECU from Matrix and all Frames.
@@ -2209,23 +2852,30 @@ class CanMatrix(object):
 
         for ecu in ecu_list:
             if ecu in self.ecus:
+                length = len(self.ecus)
                 self.ecus.remove(ecu)
+                self._ecus_by_name = self._index_remove(self._ecus_by_name, length, ecu.name, ecu)
+                if ecu._matrix is self:
+                    ecu._matrix = None
                 for frame in self.frames:
                     frame.del_transmitter(ecu.name)
+                    touched = ecu.name in frame.receivers
                     for signal in frame.signals:
-                        signal.del_receiver(ecu.name)
-
-                    frame.update_receiver()
+                        if ecu.name in signal.receivers:
+                            signal.receivers.remove(ecu.name)
+                            touched = True
+                    if touched:
+                        frame.update_receiver()
 
     def update_ecu_list(self):  # type: () -> None
         """Check all Frames and add unknown ECUs to the Matrix ECU list."""
+        known_names = {ecu.name.strip() for ecu in self.ecus}
         for frame in self.frames:
-            for transmit_ecu in frame.transmitters:
-                self.add_ecu(Ecu(transmit_ecu))
             frame.update_receiver()
-            for signal in frame.signals:
-                for receive_ecu in signal.receivers:
-                    self.add_ecu(Ecu(receive_ecu))
+            for ecu_name in itertools.chain(frame.transmitters, frame.receivers):
+                if ecu_name not in known_names:
+                    known_names.add(ecu_name)
+                    self.ecus.append(Ecu(ecu_name))
 
     def rename_frame(self, frame_or_name, new_name):  # type: (typing.Union[Frame,str], str) -> None
         """Rename Frame.
@@ -2238,13 +2888,20 @@ class CanMatrix(object):
             if old_name[-1] == '*':
                 old_prefix_len = len(old_name)-1
                 if frame.name[:old_prefix_len] == old_name[:-1]:
-                    frame.name = new_name + frame.name[old_prefix_len:]
+                    self._set_frame_name(frame, new_name + frame.name[old_prefix_len:])
             if old_name[0] == '*':
                 old_suffix_len = len(old_name)-1
                 if frame.name[-old_suffix_len:] == old_name[1:]:
-                    frame.name = frame.name[:-old_suffix_len] + new_name
+                    self._set_frame_name(frame, frame.name[:-old_suffix_len] + new_name)
             elif frame.name == old_name:
-                frame.name = new_name
+                self._set_frame_name(frame, new_name)
+
+    def _set_frame_name(self, frame, name):  # type: (Frame, str) -> None
+        """Rename frame of this Matrix, keeping the name index up to date."""
+        old_name = frame.name
+        index = self._frames_by_name
+        frame.name = name
+        self._frames_by_name = self._index_move(index, len(self.frames), old_name, name, frame)
 
     def del_frame(self, frame_or_name):  # type: (typing.Union[Frame, str]) -> None
         """Delete Frame from Matrix.
@@ -2252,7 +2909,7 @@ class CanMatrix(object):
         :param Frame or str frame_or_name: Frame or name to delete"""
         frame = frame_or_name if isinstance(frame_or_name, Frame) else self.frame_by_name(frame_or_name)
         if frame:
-            self.frames.remove(frame)
+            self.remove_frame(frame)
 
     def rename_signal(self, signal_or_name, new_name):  # type: (typing.Union[Signal, str], str) -> None
         """Rename Signal.
@@ -2282,14 +2939,28 @@ class CanMatrix(object):
 
         :param Signal or str signal: Signal instance or glob pattern to be deleted"""
         if isinstance(signal, Signal):
+            frame = signal._frame
+            if frame is not None and frame._matrix is self and frame.signal_by_name(signal.name) is signal:
+                # fast path: the signal knows its frame, the frame knows its matrix (see _link_frame)
+                frame.signals.remove(signal)
+                frame.invalidate_caches()
+                signal._frame = None
+                return
             for frame in self.frames:
                 if signal in frame.signals:
                     frame.signals.remove(signal)
+                    frame.invalidate_caches()
+            signal._frame = None
         else:
             for frame in self.frames:
                 signal_list = frame.glob_signals(signal)
+                if not signal_list:
+                    continue
+                drop_ids = {id(sig) for sig in signal_list}
+                frame.signals[:] = [sig for sig in frame.signals if id(sig) not in drop_ids]
+                frame.invalidate_caches()
                 for sig in signal_list:
-                    frame.signals.remove(sig)
+                    sig._frame = None
 
     def add_signal_receiver(self, globFrame, globSignal, ecu):  # type: (str, str, str) -> None
         """Add Receiver to all Frames and Signals by glob pattern.
@@ -2394,21 +3065,21 @@ class CanMatrix(object):
         return self.frame_by_id(frame_id).encode(data)
 
     def decode_pycan(self, pycan_msg):
-        """Return OrderedDictionary with Signal Name: object decodedSignal
+        """Return dictionary with Signal Name: object decodedSignal
 
         :param pycan_msg: python-can message
-        :return: OrderedDictionary
+        :return: dictionary
         """
         canmatrix_arbitration_id = canmatrix.ArbitrationId(pycan_msg.arbitration_id, extended=pycan_msg.is_extended_id)
         return self.decode(canmatrix_arbitration_id, pycan_msg.data)
 
     def decode(self, frame_id, data):  # type: (ArbitrationId, bytes) -> typing.Mapping[str, typing.Any]
-        """Return OrderedDictionary with Signal Name: object decodedSignal
+        """Return dictionary with Signal Name: object decodedSignal
 
         :param frame_id: frame id
         :param data: Iterable or bytes.
             i.e. (0xA1, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7, 0xA8)
-        :return: OrderedDictionary
+        :return: dictionary
         """
         if not self.contains_j1939:
             return self.frame_by_id(frame_id).decode(data)
@@ -2423,45 +3094,68 @@ class CanMatrix(object):
         else:
             return {}
 
-    def enum_attribs_to_values(self):  # type: () -> None
-        for define in self.ecu_defines:
-            if self.ecu_defines[define].type == "ENUM":
-                for bu in self.ecus:
-                    if define in bu.attributes:
-                        bu.attributes[define] = self.ecu_defines[define].values[int(float(bu.attributes[define]))]
-
-        for define in self.frame_defines:
-            if self.frame_defines[define].type == "ENUM":
-                for frame in self.frames:
-                    if define in frame.attributes:
-                        frame.attributes[define] = self.frame_defines[define].values[int(float(frame.attributes[define]))]
+    def make_decoder(self):
+        # type: () -> typing.Callable[[ArbitrationId, bytes], typing.Mapping[str, typing.Any]]
+        """Return a function behaving like `decode`, for decoding many messages in a loop.
 
-        for define in self.signal_defines:
-            if self.signal_defines[define].type == "ENUM":
-                for frame in self.frames:
-                    for signal in frame.signals:
-                        if define in signal.attributes:
-                            signal.attributes[define] = self.signal_defines[define].values[int(float(signal.attributes[define]))]
+        The Frame lookup table is built once, so each call only costs a dict lookup.
+        The decoder reflects the Frames of the matrix at the time of the call;
+        unknown ids are handed over to `decode`.
+
+        :return: function taking frame id and data, returning dictionary
+        """
+        decoders = {}  # type: typing.Dict[typing.Tuple[int, bool], typing.Callable]
+        j1939 = self.contains_j1939
+        for frame in self.frames:
+            if j1939 and not frame.arbitration_id.extended:
+                continue  # j1939 matrices do not decode standard ids
+            key = (frame.arbitration_id.id, frame.arbitration_id.extended)
+            decoders.setdefault(key, frame.decode)  # first frame wins, like frame_by_id
+        fallback = self.decode
+
+        def decode(frame_id, data):  # type: (ArbitrationId, bytes) -> typing.Mapping[str, typing.Any]
+            frame_decode = decoders.get((frame_id.id, frame_id.extended))
+            if frame_decode is None:
+                return fallback(frame_id, data)
+            return frame_decode(data)
+        return decode
+
+    def _defines_with_owners(self):
+        # type: () -> typing.Iterator[typing.Tuple[typing.Mapping[str, Define], typing.Iterable[typing.Any], bool]]
+        """Yield (defines, objects carrying their attributes, is_signal_level) for ECUs, frames and signals."""
+        yield self.ecu_defines, self.ecus, False
+        yield self.frame_defines, self.frames, False
+        yield self.signal_defines, (signal for frame in self.frames for signal in frame.signals), True
+
+    def enum_attribs_to_values(self):  # type: () -> None
+        for defines, owners, _ in self._defines_with_owners():
+            enum_defines = [(name, define.values) for name, define in defines.items() if define.type == "ENUM"]
+            if not enum_defines:
+                continue
+            for owner in owners:
+                attributes = owner.attributes
+                for name, values in enum_defines:
+                    if name in attributes:
+                        attributes[name] = values[int(float(attributes[name]))]
 
     def enum_attribs_to_keys(self):  # type: () -> None
-        for define in self.ecu_defines:
-            if self.ecu_defines[define].type == "ENUM":
-                for bu in self.ecus:
-                    if define in bu.attributes:
-                        if len(bu.attributes[define]) > 0:
-                            bu.attributes[define] = self.ecu_defines[define].values.index(bu.attributes[define])
-                            bu.attributes[define] = str(bu.attributes[define])
-        for define in self.frame_defines:
-            if self.frame_defines[define].type == "ENUM":
-                for frame in self.frames:
-                    if define in frame.attributes:
-                        if len(frame.attributes[define]) > 0:
-                            frame.attributes[define] = self.frame_defines[define].values.index(frame.attributes[define])
-                            frame.attributes[define] = str(frame.attributes[define])
-        for define in self.signal_defines:
-            if self.signal_defines[define].type == "ENUM":
-                for frame in self.frames:
-                    for signal in frame.signals:
-                        if define in signal.attributes:
-                            signal.attributes[define] = self.signal_defines[define].values.index(signal.attributes[define])
-                            signal.attributes[define] = str(signal.attributes[define])
+        for defines, owners, is_signal_level in self._defines_with_owners():
+            enum_defines = []
+            for name, define in defines.items():
+                if define.type == "ENUM":
+                    keys = {}  # type: typing.Dict[str, str]
+                    for index, value in enumerate(define.values):
+                        keys.setdefault(value, str(index))
+                    enum_defines.append((name, define.values, keys))
+            if not enum_defines:
+                continue
+            for owner in owners:
+                attributes = owner.attributes
+                for name, values, keys in enum_defines:
+                    if name in attributes:
+                        value = attributes[name]
+                        # empty ECU and frame values are kept (signals have no such check)
+                        if not is_signal_level and len(value) == 0:
+                            continue
+                        key = keys.get(value)
+                        attributes[name] = key if key is not None else str(values.index(value))
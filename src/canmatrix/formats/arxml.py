@@ -40,7 +40,11 @@ import canmatrix.types
 import canmatrix.utils
 
 logger = logging.getLogger(__name__)
-default_float_factory = decimal.Decimal
+
+
+def default_float_factory(value):  # type: (typing.Any) -> canmatrix.types.PhysicalValue
+    return canmatrix.canmatrix.physical_value_converter(value)
+
 
 clusterExporter = 1
 clusterImporter = 1
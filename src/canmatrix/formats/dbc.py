@@ -25,7 +25,6 @@
 
 import collections
 import copy
-import decimal
 import logging
 import math
 import re
@@ -37,8 +36,8 @@ import canmatrix.utils
 logger = logging.getLogger(__name__)
 
 
-def default_float_factory(value):  # type: (typing.Any) -> decimal.Decimal
-    return decimal.Decimal(value)
+def default_float_factory(value):  # type: (typing.Any) -> canmatrix.types.PhysicalValue
+    return canmatrix.canmatrix.physical_value_converter(value)
 
 
 def normalize_name(name, whitespace_replacement):  # type: (str, str) -> str
@@ -215,10 +214,10 @@ def dump(in_db, f, **options):
                 s.name = s.name[0:32]
                 db.add_signal_defines("SystemSignalLongSymbol", "STRING")
 
-        normalized_names = collections.OrderedDict((
-            (s, normalize_name(s.name, whitespace_replacement))
+        normalized_names = {
+            s: normalize_name(s.name, whitespace_replacement)
             for s in frame.signals
-        ))
+        }
 
         # remove "-" from frame names
         if compatibility:
@@ -227,8 +226,6 @@ def dump(in_db, f, **options):
         duplicate_signal_totals = collections.Counter(normalized_names.values())
         duplicate_signal_counter = collections.Counter()  # type: typing.Counter[str]
 
-        numbered_names = collections.OrderedDict()  # type: ignore
-
         if frame.cycle_time != 0:
             frame.add_attribute("GenMsgCycleTime", frame.cycle_time)
 
@@ -25,7 +25,6 @@
 #
 
 import copy
-import decimal
 import logging
 import math
 import re
@@ -37,8 +36,8 @@ import canmatrix
 logger = logging.getLogger(__name__)
 
 
-def default_float_factory(value):  # type: (typing.Any) -> decimal.Decimal
-    return decimal.Decimal(value)
+def default_float_factory(value):  # type: (typing.Any) -> canmatrix.types.PhysicalValue
+    return canmatrix.canmatrix.physical_value_converter(value)
 
 
 # TODO support for [START_PARAM_NODE_RX_SIG]
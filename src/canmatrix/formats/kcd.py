@@ -24,7 +24,6 @@
 # kcd-files are the can-matrix-definitions of the kayak
 # (http://kayak.2codeornot2code.org/)
 
-import decimal
 import os
 import re
 import typing
@@ -41,8 +40,8 @@ clusterImporter = 1
 _Element = lxml.etree._Element
 
 
-def default_float_factory(value):  # type: (typing.Any) -> decimal.Decimal
-    return decimal.Decimal(value)
+def default_float_factory(value):  # type: (typing.Any) -> canmatrix.types.PhysicalValue
+    return canmatrix.canmatrix.physical_value_converter(value)
 
 
 def create_signal(signal, node_list, type_enums):
@@ -24,7 +24,6 @@
 # sym-files are the can-matrix-definitions of the Peak Systems Tools
 
 import collections
-import decimal
 import logging
 import sys
 import typing
@@ -38,8 +37,8 @@ import canmatrix.utils
 logger = logging.getLogger(__name__)
 
 
-def default_float_factory(value):  # type: (typing.Any) -> decimal.Decimal
-    return decimal.Decimal(value)
+def default_float_factory(value):  # type: (typing.Any) -> canmatrix.types.PhysicalValue
+    return canmatrix.canmatrix.physical_value_converter(value)
 
 
 @attr.s
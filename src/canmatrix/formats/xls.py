@@ -23,11 +23,11 @@
 # this script exports xls-files from a canmatrix-object
 # xls-files are the can-matrix-definitions displayed in Excel
 
-import decimal
 import logging
 import typing
 from builtins import *
 
+import attr
 import xlrd
 import xlwt
 
@@ -35,7 +35,11 @@ import canmatrix
 import canmatrix.formats.xls_common
 
 logger = logging.getLogger(__name__)
-default_float_factory = decimal.Decimal
+
+
+def default_float_factory(value):  # type: (typing.Any) -> canmatrix.types.PhysicalValue
+    return canmatrix.canmatrix.physical_value_converter(value)
+
 
 # Font Size : 8pt * 20 = 160
 # font = 'font: name Arial Narrow, height 160'
@@ -327,7 +331,7 @@ def parse_value_name_column(value_name, value_str, signal_size, float_factory):
 def read_additional_signal_attributes(signal, attribute_name, attribute_value):
     if not attribute_name.startswith("signal"):
         return
-    if attribute_name.replace("signal.", "") in vars(signal):
+    if attribute_name.replace("signal.", "") in attr.fields_dict(type(signal)):
         command_str = attribute_name + "="
         command_str += str(attribute_value)
         if len(str(attribute_value)) > 0:
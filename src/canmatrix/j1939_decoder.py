@@ -10,6 +10,11 @@ try:
 except ImportError:
     from pkgutil import get_data as read_binary
 
+# transport protocol PGNs, ArbitrationId.from_pgn(..).pgn does the pf >= 240 check
+_tp_cm_pgn = canmatrix.ArbitrationId.from_pgn(0xECFF).pgn
+_address_claimed_pgn = canmatrix.ArbitrationId.from_pgn(0xEEFF).pgn
+_tp_dt_pgn = canmatrix.ArbitrationId.from_pgn(0xEBFF).pgn
+
 
 @attr.s
 class j1939_decoder(object):
@@ -23,18 +28,19 @@ class j1939_decoder(object):
     _data = attr.ib(init=False, default=bytearray())
 
     def decode(self, arbitration_id, can_data, matrix = None):
+        pgn = arbitration_id.pgn
         if matrix is not None:
-            frame = matrix.frame_by_pgn(arbitration_id.pgn)
+            frame = matrix.frame_by_pgn(pgn)
         else:
             frame = None
         if frame is not None:
             return ("regular " + frame.name, frame.decode(can_data))
-        elif self.j1939_db.frame_by_pgn(arbitration_id.pgn) is not None:
+        j1939_frame = self.j1939_db.frame_by_pgn(pgn)
+        if j1939_frame is not None:
             signals = self.j1939_db.decode(arbitration_id,can_data)
-            frame_name = self.j1939_db.frame_by_pgn(arbitration_id.pgn).name
-            return ("J1939 known: " + frame_name, signals)
+            return ("J1939 known: " + j1939_frame.name, signals)
 
-        elif arbitration_id.pgn == canmatrix.ArbitrationId.from_pgn(0xECFF).pgn and can_data[0] == 32:
+        elif pgn == _tp_cm_pgn and can_data[0] == 32:
             # BAM detected
             self.length = (int(can_data[2]) << 8) + int(can_data[1])
             self.count_succesive_frames = int(can_data[3])
@@ -43,7 +49,7 @@ class j1939_decoder(object):
             self._data = bytearray()
             return ("BAM          ", {})
 
-        elif arbitration_id.pgn == canmatrix.ArbitrationId.from_pgn(0xECFF).pgn and can_data[0] == 16:
+        elif pgn == _tp_cm_pgn and can_data[0] == 16:
             # RTS detected
             self.length = (int(can_data[2]) << 8) + int(can_data[1])
             self.count_of_packets = int(can_data[3])
@@ -51,35 +57,35 @@ class j1939_decoder(object):
             self.transfered_pgn = (int(can_data[7]) << 16) + (int(can_data[6]) << 8) + int(can_data[5])
             return ("ERROR - decoding RTS not yet implemented")
 
-        elif arbitration_id.pgn == canmatrix.ArbitrationId.from_pgn(0xECFF).pgn and can_data[0] == 17:
+        elif pgn == _tp_cm_pgn and can_data[0] == 17:
             # CTS detected
             self.max_packets_at_once = can_data[1]
             self.sequence_number_to_start = can_data[2]
             self.transfered_pgn = (int(can_data[7]) << 16) + (int(can_data[6]) << 8) + int(can_data[5])
             return ("ERROR - decoding CTS not yet implemented")
 
-        elif arbitration_id.pgn == canmatrix.ArbitrationId.from_pgn(0xECFF).pgn and can_data[0] == 19:
+        elif pgn == _tp_cm_pgn and can_data[0] == 19:
             # ACK detected
             self.message_size = (int(can_data[2]) << 8) + int(can_data[1])
             self.count_of_packets = int(can_data[3])
             self.transfered_pgn = (int(can_data[7]) << 16) + (int(can_data[6]) << 8) + int(can_data[5])
             return ("ERROR - decoding ACK not yet implemented")
 
-        elif arbitration_id.pgn == canmatrix.ArbitrationId.from_pgn(0xECFF).pgn and can_data[0] == 255:
+        elif pgn == _tp_cm_pgn and can_data[0] == 255:
             # Connection Abort
             self.abort_reason = can_data[1]
             self.transfered_pgn = (int(can_data[7]) << 16) + (int(can_data[6]) << 8) + int(can_data[5])
             return ("ERROR - decoding Connection Abbort not yet implemented")
 
 
-        elif arbitration_id.pgn == canmatrix.ArbitrationId.from_pgn(0xEEFF).pgn:
+        elif pgn == _address_claimed_pgn:
             #Address Claimed
             #arbitration_id.j1939_source
             #name in can_data[0:8]
             return ("ERROR - address claim detected not yet implemented")
             pass
 
-        elif arbitration_id.pgn == canmatrix.ArbitrationId.from_pgn(0xEBFF).pgn:
+        elif pgn == _tp_dt_pgn:
             # transfer data
             self._data = self._data + can_data[1:min(8, self.bytes_left + 1)]
             self.bytes_left = max(self.bytes_left - 7, 0)
@@ -48,28 +48,23 @@ def quote_aware_comma_split(string):  # type: (str) -> typing.List[str]
     :return: ['a', 'b", c"', 'd']),
     """
     fields = []
-    quoted = False
-    field = ""
-    # Separate string by unquoted commas
-    for char in string:
-        if char == ',':
-            if not quoted:
-                fields.append(field)
-                field = ""
-                continue
-        if char == '"':
-            quoted = not quoted
-        field += char
-    if field:
+    field = None  # type: typing.Optional[str]
+    # Separate string by unquoted commas: join pieces while a quote is open (odd number of quotes)
+    for piece in string.split(','):
+        field = piece if field is None else field + ',' + piece
+        if field.count('"') % 2 == 0:
+            fields.append(field)
+            field = None
+    if field is not None:
         fields.append(field)
-    # Remove surrounding whitespace from fields
-    fields = [f.strip() for f in fields]
-    # Remove "" that surround entire fields
-    for i, f in enumerate(fields):
-        if len(f) > 1:
-            if f.startswith('"') and f.endswith('"'):
-                fields[i] = f[1:-1]
-    return fields
+    if fields and not fields[-1]:
+        # no empty field after a trailing comma
+        fields.pop()
+    # Remove surrounding whitespace and "" that surround entire fields
+    return [
+        f[1:-1] if len(f) > 1 and f.startswith('"') and f.endswith('"') else f
+        for f in (f.strip() for f in fields)
+    ]
 
 
 def guess_value(text_value):  # type: (str) -> str
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import copy
 import decimal
 
 import pytest
@@ -17,6 +18,27 @@ def test_signal_defaults_to_decimal():
     assert isinstance(signal.factor, decimal.Decimal)
 
 
+def test_signal_use_float():
+    canmatrix.canmatrix.use_decimal(False)
+    try:
+        signal = canmatrix.canmatrix.Signal(size=8, offset=4, factor=0.5)
+    finally:
+        canmatrix.canmatrix.use_decimal(True)
+
+    assert isinstance(signal.offset, float)
+    assert isinstance(signal.factor, float)
+    assert isinstance(signal.max, float)
+    assert signal.raw2phys(2) == 5.0
+    assert signal.phys2raw(5.0) == 2
+    assert isinstance(canmatrix.canmatrix.Signal(offset=4).offset, decimal.Decimal)
+    # signals keep their number type after switching back
+    assert signal.calc_max() == 67.5
+    assert signal.set_min(None) == -60.0
+    assert copy.deepcopy(signal).float_factory is float
+    signal.factor = decimal.Decimal("0.5")
+    assert signal.float_factory is float
+
+
 def test_enum_defines_from_decimal():
     db = canmatrix.CanMatrix()
     db.add_frame_defines("test_enum", 'ENUM  "eins","zwei","drei","vier"')
@@ -26,7 +48,10 @@ def test_enum_defines_from_decimal():
     f1.add_attribute("test_enum", "2.00001")
     db.add_frame(f1)
     db.enum_attribs_to_values()
- 
+    assert f1.attributes["test_enum"] == "drei"
+    db.enum_attribs_to_keys()
+    assert f1.attributes["test_enum"] == "2"
+
 
 def test_encode_signal():
     s1 = canmatrix.canmatrix.Signal('signal', size=8)
@@ -296,6 +321,15 @@ def test_signal_encode_named_value(some_signal):
     assert some_signal.phys2raw("Error") == 254
 
 
+def test_signal_encode_named_value_after_values_change(some_signal):
+    some_signal.add_values(254, "Error")
+    assert some_signal.phys2raw("Error") == 254
+    some_signal.values[254] = "Fault"
+    some_signal.values[253] = "Error"
+    assert some_signal.phys2raw("Error") == 253
+    assert some_signal.phys2raw("Fault") == 254
+
+
 def test_signal_encode_invalid_named_value(some_signal):
     with pytest.raises(decimal.InvalidOperation):
         some_signal.phys2raw("wrong")
@@ -529,6 +563,17 @@ def test_frame_create_dummy_signals_covers_all_bits():
     assert frame.get_frame_layout().count([]) == 0
 
 
+def test_frame_create_dummy_signals_keeps_last_bit():
+    frame = canmatrix.canmatrix.Frame(size=1)
+    sig = canmatrix.canmatrix.Signal(start_bit=7, size=1, is_little_endian=False)
+    frame.add_signal(sig)
+    frame.create_dummy_signals()
+    assert len(frame.signals) == 2
+    assert frame.signals[1].start_bit == 0
+    assert frame.signals[1].size == 7
+    assert frame.get_frame_layout() == [[frame.signals[1]]] * 7 + [[sig]]
+
+
 def test_frame_update_receivers():
     frame = canmatrix.canmatrix.Frame(size=1)
     frame.add_signal(canmatrix.canmatrix.Signal(start_bit=0, size=3, receivers=["GW", "Keyboard"]))
@@ -698,6 +743,34 @@ def test_frame_find_missing_signal(empty_frame):
     assert empty_frame.signal_by_name("wrong") is None
 
 
+def test_frame_signal_by_name_after_rename(empty_frame):
+    first_signal = canmatrix.canmatrix.Signal(name="first")
+    second_signal = canmatrix.canmatrix.Signal(name="second")
+    empty_frame.add_signal(first_signal)
+    empty_frame.add_signal(second_signal)
+    assert empty_frame.signal_by_name("first") is first_signal
+    first_signal.name = "renamed"
+    second_signal.name = "first"
+    assert empty_frame.signal_by_name("first") is second_signal
+    assert empty_frame.signal_by_name("renamed") is first_signal
+    empty_frame.signals.remove(second_signal)
+    assert empty_frame.signal_by_name("first") is None
+
+
+def test_frame_deepcopy_keeps_caches_and_back_references_apart(empty_frame):
+    signal = empty_frame.add_signal(canmatrix.canmatrix.Signal(name="signal", size=8))
+    empty_frame.size = 1
+    empty_frame.decode(bytearray([1]))
+    assert copy.deepcopy(signal)._frame is None
+    frame_copy = copy.deepcopy(empty_frame)
+    assert frame_copy.signals[0]._frame is frame_copy
+    frame_copy.signals[0].set_startbit(0)
+    assert frame_copy.decode(bytearray([1]))["signal"].raw_value == 1
+    shallow_copy = copy.copy(empty_frame)
+    assert shallow_copy.signals[0] is signal
+    assert signal._frame is empty_frame
+
+
 def test_frame_glob_signals(empty_frame):
     audio_signal = canmatrix.canmatrix.Signal(name="front_audio_volume")
     empty_frame.add_signal(audio_signal)
@@ -783,6 +856,8 @@ def test_define_set_default():
     assert define.defaultValue == "string"
     define.set_default('"quoted_string"')
     assert define.defaultValue == "quoted_string"
+    define.set_default(5)
+    assert define.defaultValue == 5
 
 
 def test_define_update_enum_definition():
@@ -807,6 +882,13 @@ def test_define_for_int():
     assert define.max == 10
 
 
+def test_define_for_int_warns_about_float_bounds_every_time(caplog):
+    for _ in range(2):
+        define = canmatrix.canmatrix.Define("INT 0 2.5")
+        assert define.max == 2
+    assert caplog.text.count("integer was expected but got float") == 2
+
+
 def test_define_for_hex():
     define = canmatrix.canmatrix.Define("HEX 0 255")
     assert define.type == "HEX"
@@ -937,6 +1019,9 @@ def test_canmatrix_get_frame_by_glob(empty_matrix, empty_frame):
     f2 = canmatrix.Frame(name="nm_osek_esp")
     empty_matrix.add_frame(f2)
     assert empty_matrix.glob_frames("*osek*") == [f2]
+    assert empty_matrix.glob_frames("nm_osek_esp") == [f2]
+    empty_matrix.add_frame(canmatrix.Frame(name=None))
+    assert empty_matrix.glob_frames("nm_osek_esp") == [f2]
 
 
 def test_canmatrix_get_frame_by_name(empty_matrix, empty_frame):
@@ -948,6 +1033,66 @@ def test_canmatrix_get_frame_by_wrong_name(empty_matrix, empty_frame):
     empty_matrix.add_frame(empty_frame)
     assert empty_matrix.frame_by_name("wrong") is None
 
+
+def test_canmatrix_get_frame_after_in_place_changes(empty_matrix):
+    frame1 = canmatrix.canmatrix.Frame("frame1", arbitration_id=canmatrix.canmatrix.ArbitrationId(1))
+    frame2 = canmatrix.canmatrix.Frame("frame2", arbitration_id=canmatrix.canmatrix.ArbitrationId(2))
+    empty_matrix.add_frame(frame1)
+    empty_matrix.add_frame(frame2)
+    assert empty_matrix.frame_by_name("frame1") is frame1
+    assert empty_matrix.frame_by_id(canmatrix.canmatrix.ArbitrationId(2)) is frame2
+
+    frame1.name = "renamed"
+    frame2.arbitration_id.id = 3
+    assert empty_matrix.frame_by_name("frame1") is None
+    assert empty_matrix.frame_by_name("renamed") is frame1
+    assert empty_matrix.frame_by_id(canmatrix.canmatrix.ArbitrationId(2)) is None
+    assert empty_matrix.frame_by_id(canmatrix.canmatrix.ArbitrationId(3)) is frame2
+
+    empty_matrix.del_frame(frame1)
+    empty_matrix.frames.append(canmatrix.canmatrix.Frame("renamed"))
+    assert empty_matrix.frame_by_name("renamed") is not frame1
+
+
+def test_canmatrix_in_place_changes_keep_other_indices(empty_matrix):
+    other_matrix = canmatrix.canmatrix.CanMatrix()
+    other_matrix.add_frame(canmatrix.canmatrix.Frame("other"))
+    assert other_matrix.frame_by_name("other") is not None
+    other_index = other_matrix._frames_by_name
+
+    frame = empty_matrix.add_frame(canmatrix.canmatrix.Frame("frame", arbitration_id=canmatrix.canmatrix.ArbitrationId(1)))
+    assert empty_matrix.frame_by_name("frame") is frame
+    frame.name = "renamed"
+    frame.arbitration_id.id = 2
+    assert empty_matrix.frame_by_name("renamed") is frame
+    assert empty_matrix.frame_by_id(canmatrix.canmatrix.ArbitrationId(2)) is frame
+    assert other_matrix._frames_by_name is other_index
+
+
+def test_canmatrix_indices_follow_renames_and_removals(empty_matrix):
+    frame1 = empty_matrix.add_frame(canmatrix.canmatrix.Frame("frame1", arbitration_id=canmatrix.canmatrix.ArbitrationId(1)))
+    frame2 = empty_matrix.add_frame(canmatrix.canmatrix.Frame("frame2", arbitration_id=canmatrix.canmatrix.ArbitrationId(2)))
+    ecu = canmatrix.canmatrix.Ecu("ecu1")
+    empty_matrix.add_ecu(ecu)
+    assert empty_matrix.ecu_by_name("ecu1") is ecu
+
+    empty_matrix.rename_frame("frame1", "renamed")
+    empty_matrix.rename_frame("frame2", "renamed")
+    assert empty_matrix.frame_by_name("frame1") is None
+    assert empty_matrix.frame_by_name("renamed") is frame1
+    empty_matrix.rename_ecu("ecu1", "ecu2")
+    assert empty_matrix.ecu_by_name("ecu1") is None
+    assert empty_matrix.ecu_by_name("ecu2") is ecu
+
+    empty_matrix.del_frame(frame1)
+    assert empty_matrix.frame_by_name("renamed") is frame2
+    assert empty_matrix.frame_by_id(canmatrix.canmatrix.ArbitrationId(1)) is None
+    empty_matrix.add_ecu(canmatrix.canmatrix.Ecu("ecu2"))
+    assert empty_matrix.ecus == [ecu]
+    empty_matrix.del_ecu(ecu)
+    assert empty_matrix.ecu_by_name("ecu2") is None
+    assert "_frames_by_name" not in empty_matrix.__getstate__()
+
 def test_canmatrix_get_frame_by_pgn(empty_matrix, empty_frame):
     empty_frame.arbitration_id.id = 0xA123456
     empty_frame.arbitration_id.extended = True
@@ -1047,6 +1192,66 @@ def test_canmatrix_del_obsolete_ecus(empty_matrix):
     assert "Ecu2" in [ecu.name for ecu in empty_matrix.ecus]
 
 
+def test_canmatrix_delete_zero_signals(empty_matrix):
+    frame = canmatrix.Frame(name="frame1")
+    for name, size in (("zero1", 0), ("zero2", 0), ("signal", 8), ("zero3", 0)):
+        frame.add_signal(canmatrix.Signal(name, size=size))
+    empty_matrix.add_frame(frame)
+    empty_matrix.delete_zero_signals()
+    assert [signal.name for signal in frame.signals] == ["signal"]
+
+
+def test_canmatrix_del_signal_instance(empty_matrix):
+    frame1 = canmatrix.Frame(name="frame1")
+    signal1 = frame1.add_signal(canmatrix.Signal("signal1"))
+    frame2 = canmatrix.Frame(name="frame2")
+    signal2 = canmatrix.Signal("signal2")
+    frame2.signals.append(signal2)  # added without back reference
+    empty_matrix.add_frame(frame1)
+    empty_matrix.add_frame(frame2)
+    empty_matrix.del_signal(signal1)
+    empty_matrix.del_signal(signal2)
+    assert frame1.signals == []
+    assert frame2.signals == []
+    assert frame1.signal_by_name("signal1") is None
+
+    other_matrix = canmatrix.CanMatrix()
+    frame3 = other_matrix.add_frame(canmatrix.Frame(name="frame3"))
+    signal3 = frame3.add_signal(canmatrix.Signal("signal3"))
+    empty_matrix.del_signal(signal3)
+    assert frame3.signals == [signal3]
+
+
+def test_canmatrix_del_signal_glob(empty_matrix):
+    frame = canmatrix.Frame(name="frame1")
+    for name in ("keep1", "drop1", "keep2", "drop2"):
+        frame.add_signal(canmatrix.Signal(name))
+    empty_matrix.add_frame(frame)
+    empty_matrix.del_signal("drop*")
+    assert [signal.name for signal in frame.signals] == ["keep1", "keep2"]
+    assert frame.signal_by_name("drop1") is None
+
+
+def test_canmatrix_delete_obsolete_defines(empty_matrix):
+    empty_matrix.add_frame_defines("UsedFrameDefine", "INT 0 10")
+    empty_matrix.add_frame_defines("UnusedFrameDefine", "INT 0 10")
+    empty_matrix.add_signal_defines("UsedSignalDefine", "STRING")
+    empty_matrix.add_signal_defines("UnusedSignalDefine", "STRING")
+    empty_matrix.add_ecu_defines("UnusedEcuDefine", "STRING")
+    frame1 = canmatrix.Frame(name="frame1")
+    frame1.add_attribute("UsedFrameDefine", 1)
+    frame2 = canmatrix.Frame(name="frame2")
+    signal = canmatrix.Signal("signal1")
+    signal.add_attribute("UsedSignalDefine", "x")
+    frame2.add_signal(signal)
+    empty_matrix.add_frame(frame1)
+    empty_matrix.add_frame(frame2)
+    empty_matrix.delete_obsolete_defines()
+    assert list(empty_matrix.frame_defines) == ["UsedFrameDefine"]
+    assert list(empty_matrix.signal_defines) == ["UsedSignalDefine"]
+    assert list(empty_matrix.ecu_defines) == []
+
+
 def test_canmatrix_rename_frame_by_name(empty_matrix):
     f = canmatrix.Frame(name="F1")
     empty_matrix.add_frame(f)
@@ -1142,3 +1347,17 @@ def test_frame_compress():
     assert frame.signal_by_name("Sig2").start_bit == 12
     assert frame.signal_by_name("Sig3").start_bit == 21
     assert frame.signal_by_name("Sig4").start_bit == 26
+
+
+@pytest.mark.parametrize("length, is_float, is_signed, value", [
+    (8, False, False, 200),
+    (8, False, True, -56),
+    (13, False, True, -1),
+    (32, True, False, 1.5),
+    (64, True, False, -6.25),
+])
+def test_pack_int_matches_bitstring(length, is_float, is_signed, value):
+    bitstring = canmatrix.canmatrix.pack_bitstring(length, is_float, value, is_signed)
+    bits = canmatrix.canmatrix.pack_int(length, is_float, value, is_signed)
+    assert bits == int(bitstring, 2)
+    assert canmatrix.canmatrix.unpack_int(length, is_float, is_signed, bits) == value
@@ -100,6 +100,16 @@ class TestCanmatrixCodec(unittest.TestCase):
             for k, v in data.items():
                 assert decoded[k].signal.values[decoded[k].raw_value] == v
 
+    def test_make_decoder(self):
+        test_file = "tests/files/dbc/test.dbc"
+        for bus in formats.loadp(test_file).values():
+            decode = bus.make_decoder()
+            for frame in bus.frames:
+                data_bytes = bytes(range(frame.size))
+                decoded = decode(frame.arbitration_id, data_bytes)
+                expected = bus.decode(frame.arbitration_id, data_bytes)
+                assert {k: v.raw_value for k, v in decoded.items()} == {k: v.raw_value for k, v in expected.items()}
+
     def test_import_export_additional_frame_info(self):
         test_file = "tests/files/dbc/test.dbc"
         dbs = formats.loadp(test_file)
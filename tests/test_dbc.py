@@ -286,8 +286,7 @@ def test_writing_complex_multiplex():
     frame = canmatrix.Frame("someFrame")
     frame.is_complex_multiplexed = True
     signal = canmatrix.Signal("mx")
-    signal.mux_val_max = 5
-    signal.mux_val_min = 1
+    signal.mux_val_grp.append([1, 5])
     signal.muxer_for_signal = 4
     frame.add_signal(signal)
     db.add_frame(frame)
@@ -642,3 +641,20 @@ def test_int_attribute_zero():
     assert 'BO_ 0 0' in outdbc.getvalue().decode('utf8')
     assert 'TestEcu 1' in outdbc.getvalue().decode('utf8')
     assert 'TestEcu 0' in outdbc.getvalue().decode('utf8')
+
+
+def test_load_and_decode_with_float():
+    canmatrix.canmatrix.use_decimal(False)
+    try:
+        matrix = canmatrix.formats.loadp_flat("tests/files/dbc/test.dbc")
+    finally:
+        canmatrix.canmatrix.use_decimal(True)
+    frame = matrix.frame_by_name("testFrame1")
+    signal = frame.signal_by_name("someTestSignal")
+    assert isinstance(signal.factor, float)
+    assert isinstance(signal.initial_value, float)
+    data = frame.encode({"someTestSignal": 1, "Signal": 2})
+    decoded = frame.decode(data)
+    assert decoded["someTestSignal"].phys_value == 6.0
+    assert isinstance(decoded["someTestSignal"].phys_value, float)
+    assert decoded["Signal"].raw_value == 2
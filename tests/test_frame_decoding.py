@@ -269,3 +269,82 @@ def test_decoding_between_multiplexed_and_container_pdu():
     decoded = new_frame.decode(data)
     assert decoded["s11"].raw_value == 125
     assert decoded["s12"].raw_value == 200
+
+
+def test_decode_after_signal_changes():
+    frame = canmatrix.Frame("frame", size=2)
+    frame.add_signal(canmatrix.Signal("s1", start_bit=0, size=8, is_signed=False))
+    assert frame.decode(bytearray([1, 2]))["s1"].raw_value == 1
+
+    frame.add_signal(canmatrix.Signal("s2", start_bit=8, size=8, is_signed=False))
+    decoded = frame.decode(bytearray([1, 2]))
+    assert decoded["s1"].raw_value == 1
+    assert decoded["s2"].raw_value == 2
+
+    frame.signal_by_name("s2").start_bit = 12
+    frame.signal_by_name("s2").size = 4
+    frame.invalidate_caches()
+    assert frame.decode(bytearray([1, 0x20]))["s2"].raw_value == 2
+
+    frame.signal_by_name("s2").set_startbit(8)
+    assert frame.decode(bytearray([1, 0x23]))["s2"].raw_value == 3
+
+    # in place edits of signal position and type are picked up without invalidate_caches()
+    frame.signal_by_name("s2").size = 8
+    frame.signal_by_name("s2").is_signed = True
+    assert frame.decode(bytearray([1, 0xFE]))["s2"].raw_value == -2
+    assert frame.encode({"s1": 1, "s2": -2}) == bytearray([1, 0xFE])
+    frame.signal_by_name("s1").start_bit = 4
+    frame.signal_by_name("s1").size = 4
+    assert frame.decode(bytearray([0x30, 0xFE]))["s1"].raw_value == 3
+
+    frame.signals[1] = canmatrix.Signal("s3", start_bit=8, size=4, is_signed=False)
+    decoded = frame.decode(bytearray([0x30, 0xFE]))
+    assert "s2" not in decoded
+    assert decoded["s3"].raw_value == 0xE
+
+
+def test_decode_after_multiplexing_changes():
+    frame = canmatrix.Frame("frame", size=2)
+    frame.add_signal(canmatrix.Signal("mux", start_bit=0, size=8, is_signed=False, multiplex="Multiplexor"))
+    frame.add_signal(canmatrix.Signal("a", start_bit=8, size=8, is_signed=False, multiplex=1))
+    frame.add_signal(canmatrix.Signal("b", start_bit=8, size=8, is_signed=False, multiplex=2))
+    assert set(frame.decode(bytearray([1, 5]))) == {"mux", "a"}
+
+    frame.signal_by_name("b").mux_val = 1
+    assert set(frame.decode(bytearray([1, 5]))) == {"mux", "a", "b"}
+
+
+def test_decode_many():
+    cm = load_dbc()
+    frame = cm.frame_by_id(canmatrix.ArbitrationId(2))
+    payloads = [
+        bytearray([12, 0, 5, 112, 3, 0, 31, 131]),
+        bytearray([0] * 8),
+    ]
+    decoded = frame.decode_many(payloads)
+    for signal in frame:
+        expected = [float(frame.decode(data)[signal.name].phys_value) for data in payloads]
+        assert decoded[signal.name] == pytest.approx(expected)
+
+    with pytest.raises(canmatrix.DecodingFrameLength):
+        frame.decode_many([bytearray([0] * 7)])
+
+
+def test_byte_aligned_frame_round_trip():
+    frame = canmatrix.Frame("frame", size=8)
+    frame.add_signal(canmatrix.Signal("u8", start_bit=0, size=8, is_signed=False))
+    frame.add_signal(canmatrix.Signal("s16", start_bit=8, size=16, is_signed=True))
+    frame.add_signal(canmatrix.Signal("f32", start_bit=32, size=32, is_float=True))
+    assert frame._struct_layout() is not None
+
+    data = bytearray([0x12, 0xfe, 0xff, 0x00, 0x00, 0x00, 0xc0, 0x3f])
+    decoded = frame.decode(data)
+    assert decoded["u8"].raw_value == 0x12
+    assert decoded["s16"].raw_value == -2
+    assert decoded["f32"].raw_value == 1.5
+    assert frame.encode({"u8": 0x12, "s16": -2, "f32": 1.5}) == data
+
+    decoded = frame.decode(tuple(data))
+    assert decoded["s16"].raw_value == -2
+    assert frame.decode_many([tuple(data), list(data)])["f32"] == [1.5, 1.5]
@@ -36,6 +36,9 @@ def test_decode_number():
 
             ('"a,b",","b,c","\'\'d"e',
              ['a,b', '","b', 'c","\'\'d\"e']),
+
+            ('"a",,"b",',
+             ['a', '', 'b']),
     )
 )
 def test_quote_aware_comma_split_function(input_string, expected_list):
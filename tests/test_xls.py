@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 # -*- coding: utf-8 -*-
+import canmatrix.formats
 import canmatrix.formats.xls
 import decimal
 
@@ -19,3 +20,20 @@ def test_parse_value_name_collumn():
     assert offset == 0
     assert value_table == {5: "LabelX"}
 
+
+
+def test_read_additional_signal_attributes():
+    signal = canmatrix.Signal("signal")
+    canmatrix.formats.xls.read_additional_signal_attributes(signal, "signal.cycle_time", 100)
+    canmatrix.formats.xls.read_additional_signal_attributes(signal, "signal.unknown", 1)
+    assert signal.cycle_time == 100
+
+
+def test_xlsx_load_keeps_decimal_values():
+    db = canmatrix.formats.loadp_flat("tests/files/xlsx/test.xlsx")
+    signal = db.frame_by_name("CommandVF").signal_by_name("Voltage_command")
+    assert signal.factor == 0.1
+    assert signal.offset == decimal.Decimal("10")
+    assert isinstance(signal.offset, decimal.Decimal)
+    assert isinstance(signal.min, decimal.Decimal)
+    assert isinstance(signal.max, decimal.Decimal)